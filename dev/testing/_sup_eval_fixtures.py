@@ -0,0 +1,18 @@
+"""
+Canonical pod payloads for the SupervisorEvaluation tests.
+
+Checked in as compact JSON ``bytes`` literals so importing them (once per
+xdist worker) does no serialization; tests write them with ``write_bytes``.
+"""
+
+INSTR_PASS = (
+    b'{"instructions":"Calculate 2+2 and return PASS if correct","output_path":"result.json"}'
+)
+INSTR_TASK = b'{"instructions":"Do task","output_path":"result.json"}'
+INSTR_FIELDS = (
+    b'{"instructions":"Return JSON with fields: name, age, email","output_path":"result.json"}'
+)
+RESULT_PASS = b'{"result":"PASS"}'
+RESULT_FAIL = b'{"result":"wrong"}'
+RESULT_EMPTY = b'{"result":""}'
+RESULT_PARTIAL = b'{"result":"{\\"name\\": \\"Alice\\"}"}'
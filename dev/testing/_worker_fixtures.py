@@ -0,0 +1,60 @@
+"""
+Test doubles and payload helpers for the worker tests.
+
+A plain module rather than conftest so test modules import from it directly.
+"""
+
+import orjson
+
+# Common instructions.json payload, serialized once at import
+_INSTR_TEMPLATE = orjson.dumps({"instructions": "__PLACEHOLDER__", "output_path": "result.json"})
+
+
+def instructions_bytes(text):
+    """Fill the pre-serialized instructions template with JSON-escaped text."""
+    return _INSTR_TEMPLATE.replace(b"__PLACEHOLDER__", orjson.dumps(text)[1:-1])
+
+
+class StubCall:
+    """Lightweight callable stand-in for a mocked method; cheaper to build than Mock.
+
+    side_effect is an exception to raise on every call, or items returned in
+    order before falling back to return_value; both may be set after creation.
+    Records call_count and call_args as an (args, kwargs) tuple.
+    """
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.call_count = 0
+        self.call_args = None
+
+    @property
+    def side_effect(self):
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, value):
+        self._side_effect = value
+        if value is None or isinstance(value, BaseException):
+            self._effects = iter(())
+        else:
+            self._effects = iter(value)
+
+    @property
+    def called(self):
+        return self.call_count > 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        if isinstance(self._side_effect, BaseException):
+            raise self._side_effect
+        return next(self._effects, self.return_value)
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        self.assert_called_once()
+        assert self.call_args == (args, kwargs), f"Called with {self.call_args}"
@@ -17,9 +17,12 @@ import os
 import tempfile
 import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src.components.feedback_manager import FeedbackManager
+
 
 class TestFeedbackManager:
     """Test suite for FeedbackManager component - Red Phase"""
@@ -197,6 +200,59 @@ class TestFeedbackManager:
         feedback_file = pod_dir / "feedback.json"
         assert not feedback_file.exists(), "Validation failure should prevent file creation"
 
+    def test_write_pass_and_fail_skip_full_schema_validation(self, pod_dir):
+        """
+        write_pass/write_fail build their own dicts, so they skip the schema pass.
+        """
+        # Arrange
+        manager = FeedbackManager()
+
+        # Act
+        with patch.object(manager.validator, "validate_feedback") as mock_validate:
+            manager.write_pass(result="Done", attempts=1, pod_dir=pod_dir, pod_id="p")
+            manager.write_fail(gaps=["Missing tests"], attempt=2, pod_dir=pod_dir, pod_id="p")
+
+        # Assert
+        mock_validate.assert_not_called()
+        with open(pod_dir / "feedback.json", "r", encoding="utf-8") as f:
+            assert json.load(f)["status"] == "FAIL"
+
+    def test_write_raw_validates_external_data(self, pod_dir):
+        """
+        write_raw() is the validated entry point for externally built feedback.
+        """
+        # Arrange
+        manager = FeedbackManager()
+
+        # Act & Assert: invalid data is rejected
+        with pytest.raises(ValueError, match="validation failed"):
+            manager.write_raw({"status": "PASS", "attempts": 1}, pod_dir)
+        assert not (pod_dir / "feedback.json").exists()
+
+        # Act: valid data is written
+        file_path = manager.write_raw({"status": "PASS", "result": "ok", "attempts": 1}, pod_dir)
+
+        # Assert
+        with open(file_path, "r", encoding="utf-8") as f:
+            assert json.load(f)["result"] == "ok"
+
+    def test_accepts_str_pod_dir(self, pod_dir):
+        """
+        pod_dir may be a plain string; the returned path matches the Path form.
+        """
+        # Arrange
+        from src.components.feedback_manager import FeedbackManager
+
+        manager = FeedbackManager()
+
+        # Act
+        file_path = manager.write_pass(result="ok", attempts=1, pod_dir=str(pod_dir), pod_id="p")
+
+        # Assert
+        assert file_path == str(pod_dir / "feedback.json")
+        with open(file_path, "r", encoding="utf-8") as f:
+            assert json.load(f)["status"] == "PASS"
+
     def test_uses_atomic_write_no_partial_files(self, pod_dir):
         """
         AC5: Atomic writes (no partial files visible)
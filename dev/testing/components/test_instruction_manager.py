@@ -267,6 +267,189 @@ class TestInstructionManager:
         assert data_a["pod_id"] == "pod-a"
         assert data_b["pod_id"] == "pod-b"
 
+    def test_create_resolves_project_root_once_per_pod(self, pod_dir, temp_project_root):
+        """
+        Repeated create() calls for the same pod reuse the cached project root.
+
+        PathResolver.get_project_root() walks parent directories, so it should
+        only run on the first write to a pod.
+        """
+        # Arrange
+        from src.components.instruction_manager import InstructionManager
+
+        manager = InstructionManager()
+
+        with patch.object(
+            manager.path_resolver,
+            "get_project_root",
+            wraps=manager.path_resolver.get_project_root,
+        ) as mock_get_root:
+            # Act
+            manager.create(instructions="Attempt 1", pod_dir=pod_dir, session_id="s")
+            manager.create(instructions="Attempt 2", pod_dir=pod_dir, session_id="s")
+
+        # Assert
+        mock_get_root.assert_called_once_with(pod_dir)
+        with open(pod_dir / "instructions.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["instructions"] == "Attempt 2"
+        assert data["project_root"] == str(temp_project_root)
+
+    def test_build_instruction_data_reuses_pod_template(self, pod_dir, temp_project_root):
+        """
+        Per-pod metadata is built once per pod; per-call fields stay per call.
+        """
+        # Arrange
+        from src.components.instruction_manager import InstructionManager
+
+        manager = InstructionManager()
+        other_pod = pod_dir.parent / "other-pod"
+
+        # Act
+        first = manager._build_instruction_data("Attempt 1", pod_dir, "s1")
+        second = manager._build_instruction_data("Attempt 2", pod_dir, "s2")
+        other = manager._build_instruction_data("Attempt 1", other_pod, "s1")
+
+        # Assert
+        cache_info = manager._cached_pod_template.cache_info()
+        assert (cache_info.hits, cache_info.misses) == (1, 2)
+        assert (second.instructions, second.session_id) == ("Attempt 2", "s2")
+        assert second.pod_id == first.pod_id == "test-pod"
+        assert other.pod_id == "other-pod"
+        assert other.project_root == first.project_root == str(temp_project_root)
+        assert first.output_path == "result.json"
+        # Slotted and frozen: no per-instance __dict__, no accidental mutation
+        assert not hasattr(first, "__dict__")
+        with pytest.raises(AttributeError):
+            first.instructions = "changed"
+
+    def test_create_template_matches_generic_serialization(self, pod_dir):
+        """
+        The precompiled instructions template produces the same bytes as
+        serializing the instruction dict through FileWriter, including
+        characters that need escaping.
+        """
+        # Arrange
+        from src.components.instruction_manager import InstructionManager
+
+        manager = InstructionManager()
+        instructions_text = 'Say "hi"\n\tthen ✓ done \\ ok'
+
+        # Act
+        file_path = manager.create(
+            instructions=instructions_text, pod_dir=pod_dir, session_id='sess-"1"'
+        )
+
+        # Assert
+        written = Path(file_path).read_bytes()
+        data = json.loads(written)
+        assert data["instructions"] == instructions_text
+        assert data["session_id"] == 'sess-"1"'
+        assert written == manager.writer._serialize(data)
+
+    def test_create_writes_payload_output_path(self, pod_dir):
+        """
+        create() writes the payload's output_path rather than assuming the
+        default, in the same bytes FileWriter would produce.
+        """
+        # Arrange
+        import dataclasses
+
+        from src.components.instruction_manager import InstructionManager
+
+        manager = InstructionManager()
+        build = InstructionManager._build_instruction_data
+
+        def build_with_output_path(self, instructions, pod_dir, session_id):
+            payload = build(self, instructions, pod_dir, session_id)
+            return dataclasses.replace(payload, output_path='out/"custom".json')
+
+        # Act (patched on the class: instances have __slots__)
+        with patch.object(InstructionManager, "_build_instruction_data", build_with_output_path):
+            file_path = manager.create(instructions="Task", pod_dir=pod_dir, session_id="s")
+
+        # Assert
+        written = Path(file_path).read_bytes()
+        data = json.loads(written)
+        assert data["output_path"] == 'out/"custom".json'
+        assert written == manager.writer._serialize(data)
+
+    def test_create_serializes_writes_with_pod_lock_not_flock(self, pod_dir):
+        """
+        By default create() guards the write with a per-pod thread lock and
+        replaces instructions.json atomically instead of using FileWriter's
+        flock-based write.
+        """
+        # Arrange
+        from src.components.instruction_manager import InstructionManager
+
+        manager = InstructionManager()
+
+        with (
+            patch.object(
+                manager.writer, "write_bytes_with_lock", side_effect=AssertionError("flock used")
+            ),
+            patch.object(
+                manager.writer, "write_bytes_atomic", wraps=manager.writer.write_bytes_atomic
+            ) as mock_atomic_write,
+        ):
+            # Act
+            manager.create(instructions="Attempt 1", pod_dir=pod_dir, session_id="s")
+            manager.create(instructions="Attempt 2", pod_dir=pod_dir, session_id="s")
+
+        # Assert: atomic writes, no temp files left, the pod's lock released
+        assert mock_atomic_write.call_count == 2
+        assert sorted(p.name for p in pod_dir.iterdir()) == ["instructions.json"]
+        assert not manager._pod_lock(pod_dir).locked()
+        with open(pod_dir / "instructions.json", "r", encoding="utf-8") as f:
+            assert json.load(f)["instructions"] == "Attempt 2"
+
+    def test_pod_caches_and_locks_stay_bounded(self, pod_dir):
+        """
+        Per-pod metadata and write locks do not grow with the number of pods
+        a long-lived manager has written.
+        """
+        # Arrange
+        from src.components import instruction_manager
+        from src.components.instruction_manager import InstructionManager
+
+        manager = InstructionManager()
+        cache_size = instruction_manager._TEMPLATE_CACHE_SIZE
+        pods = [pod_dir.parent / f"pod-{i}" for i in range(cache_size + 10)]
+
+        # Act
+        for pod in pods:
+            manager._build_instruction_data("Task", pod, "s")
+
+        # Assert: oldest templates evicted, lock pool fixed, same pod -> same lock
+        assert manager._cached_pod_template.cache_info().currsize == cache_size
+        assert len(manager._write_locks) == instruction_manager._WRITE_LOCK_STRIPES
+        assert manager._pod_lock(pods[0]) is manager._pod_lock(Path(str(pods[0])))
+        assert manager._pod_lock(pods[0]) is manager._pod_lock(str(pods[0]))
+
+    @pytest.mark.parametrize(
+        "flag,uses_flock",
+        [("1", True), ("true", True), ("YES", True), ("0", False), ("false", False), ("", False)],
+    )
+    def test_create_uses_file_lock_when_multiprocess(self, pod_dir, monkeypatch, flag, uses_flock):
+        """An enabled LELA_MULTIPROCESS switches create() back to the flock-based write."""
+        # Arrange
+        from src.components.instruction_manager import InstructionManager
+
+        monkeypatch.setenv("LELA_MULTIPROCESS", flag)
+        manager = InstructionManager()
+
+        with patch.object(
+            manager.writer, "write_bytes_with_lock", wraps=manager.writer.write_bytes_with_lock
+        ) as mock_locked_write:
+            # Act
+            file_path = manager.create(instructions="Shared", pod_dir=pod_dir, session_id="s")
+
+        # Assert
+        assert mock_locked_write.called is uses_flock
+        with open(file_path, "r", encoding="utf-8") as f:
+            assert json.load(f)["instructions"] == "Shared"
+
     def test_normalize_path_handles_non_private_var_paths(self, pod_dir):
         """
         Test _normalize_path() returns unchanged path for non-macOS /private/var paths.
@@ -289,6 +472,44 @@ class TestInstructionManager:
         assert manager._normalize_path(Path("/tmp/test")) == "/tmp/test"
         assert manager._normalize_path(Path("/home/user")) == "/home/user"
 
+    @pytest.mark.parametrize(
+        "is_macos,expected",
+        [(True, "/var/folders/tmp/project"), (False, "/private/var/folders/tmp/project")],
+    )
+    def test_normalize_path_rewrites_private_var_only_on_macos(
+        self, monkeypatch, is_macos, expected
+    ):
+        """
+        Test _normalize_path() only undoes the /private/var symlink on macOS.
+
+        Other platforms have no such symlink, so the path is returned unchanged.
+        """
+        # Arrange
+        from src.components import instruction_manager
+        from src.components.instruction_manager import InstructionManager
+
+        monkeypatch.setattr(instruction_manager, "_IS_MACOS", is_macos)
+        manager = InstructionManager()
+
+        # Act
+        normalized = manager._normalize_path(Path("/private/var/folders/tmp/project"))
+
+        # Assert
+        assert normalized == expected
+
+    def test_normalize_path_only_strips_whole_private_var_component(self, monkeypatch):
+        """Siblings like /private/var2 are not mistaken for /private/var on macOS."""
+        # Arrange
+        from src.components import instruction_manager
+        from src.components.instruction_manager import InstructionManager
+
+        monkeypatch.setattr(instruction_manager, "_IS_MACOS", True)
+        manager = InstructionManager()
+
+        # Act & Assert
+        assert manager._normalize_path(Path("/private/var2/project")) == "/private/var2/project"
+        assert manager._normalize_path("/private/var/tmp") == "/var/tmp"
+
     def test_create_with_invalid_json_schema_raises_detailed_error(self, pod_dir):
         """
         Test create() with data that fails JSONValidator schema validation.
@@ -725,6 +725,116 @@ class TestLLMProvider:
         assert "api_key" in call_config, "API key should be resolved"
         # Note: exact key value may be transformed, but should be derived from environment
 
+    def test_generate_caches_config_until_file_changes(self, valid_llm_config, mocker):
+        """
+        Repeated generate() calls with one config_path load and validate the config
+        once; rewriting the file invalidates the cached config.
+        """
+        # Arrange
+        import os
+
+        from src.components.llm_provider import LLMProvider
+
+        mocker.patch.dict("os.environ", {"TEST_API_KEY": "test-key"})
+        mock_llm_call = mocker.patch("src.primitives.llm_client.LLMClient.call", return_value="ok")
+        mocker.patch("src.primitives.logger.Logger", return_value=Mock())
+
+        provider = LLMProvider()
+        load = mocker.spy(provider.config_loader, "load")
+        provider_config = {"config_path": str(valid_llm_config)}
+
+        # Act
+        provider.generate(prompt="First", provider_config=provider_config)
+        provider.generate(prompt="Second", provider_config=provider_config)
+
+        # Assert: loaded once for both calls
+        assert load.call_count == 1
+
+        # Act: change the file (bump mtime explicitly so the change is always visible)
+        config = json.loads(valid_llm_config.read_text(encoding="utf-8"))
+        config["model"] = "claude-opus-4"
+        valid_llm_config.write_text(json.dumps(config), encoding="utf-8")
+        stat = valid_llm_config.stat()
+        os.utime(valid_llm_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        provider.generate(prompt="Third", provider_config=provider_config)
+
+        # Assert: reloaded and the new model is used
+        assert load.call_count == 2
+        assert mock_llm_call.call_args[1]["config"]["model"] == "claude-opus-4"
+
+    def test_generate_reports_missing_config_file(self, temp_config_dir, mocker):
+        """A missing config file surfaces ConfigLoader's error and is not cached."""
+        # Arrange
+        from src.components.llm_provider import LLMProvider
+
+        mocker.patch("src.primitives.logger.Logger", return_value=Mock())
+        provider = LLMProvider()
+        config_path = str(temp_config_dir / "missing.json")
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            provider.generate(prompt="Test", provider_config={"config_path": config_path})
+        assert provider._config_cache == {}
+
+    def test_generate_skips_info_logging_when_disabled(self, valid_llm_config, mocker):
+        """Info events are skipped when info is filtered out; errors are still logged."""
+        # Arrange
+        from src.components.llm_provider import LLMProvider
+        from src.primitives.llm_client import LLMAPIError
+
+        mocker.patch.dict("os.environ", {"TEST_API_KEY": "test-key"})
+        mocker.patch(
+            "src.primitives.llm_client.LLMClient.call", side_effect=["ok", LLMAPIError("boom")]
+        )
+        mock_logger = Mock()
+        mock_logger.is_enabled_for.return_value = False
+        mocker.patch("src.primitives.logger.Logger", return_value=mock_logger)
+
+        provider = LLMProvider()
+        provider_config = {"config_path": str(valid_llm_config)}
+
+        # Act
+        assert provider.generate(prompt="First", provider_config=provider_config) == "ok"
+        with pytest.raises(LLMAPIError):
+            provider.generate(prompt="Second", provider_config=provider_config)
+
+        # Assert
+        mock_logger.is_enabled_for.assert_called_with("info")
+        mock_logger.info.assert_not_called()
+        mock_logger.error.assert_called_once()
+
+    def test_generate_resolves_api_key_once_per_config_load(self, valid_llm_config, mocker):
+        """
+        The API key is read from the environment when the config is loaded and
+        reused from the cache; a missing variable is not cached.
+        """
+        # Arrange
+        import os
+
+        from src.components.llm_provider import LLMProvider
+
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_llm_call = mocker.patch("src.primitives.llm_client.LLMClient.call", return_value="ok")
+        mocker.patch("src.primitives.logger.Logger", return_value=Mock())
+
+        provider = LLMProvider()
+        provider_config = {"config_path": str(valid_llm_config)}
+
+        # Act & Assert: missing variable fails and leaves nothing cached
+        with pytest.raises(ValueError, match="TEST_API_KEY"):
+            provider.generate(prompt="First", provider_config=provider_config)
+        assert provider._config_cache == {}
+
+        # Act: variable defined, then removed while the config file is unchanged
+        os.environ["TEST_API_KEY"] = "test-key"
+        provider.generate(prompt="Second", provider_config=provider_config)
+        del os.environ["TEST_API_KEY"]
+        provider.generate(prompt="Third", provider_config=provider_config)
+
+        # Assert: the key resolved at load time is reused
+        assert mock_llm_call.call_count == 2
+        assert mock_llm_call.call_args[1]["config"]["api_key"] == "test-key"
+
     def test_generate_raises_error_when_config_path_missing(self, mocker):
         """
         AC7: generate() raises ValueError when config_path is missing
@@ -0,0 +1,269 @@
+"""
+Shared pytest fixtures for the lela-ai test suite.
+
+Component managers hold no per-call state (it is all passed as arguments), so a
+single instance per session is shared across tests. Some keep caches, which
+are safe to share because their keys never collide across tests:
+
+- InstructionManager: per-pod metadata and write locks, and its PathResolver's
+  project-root cache, all keyed by directories under each test's own temp dir
+  (the locks only serialize writes).
+- LLMProvider: validated configs keyed by config_path and invalidated when the
+  file's mtime or size changes. ``executor`` swaps the provider for a mock;
+  tests needing a real provider build their own WorkerExecutor.
+
+Mocks are the opposite: they record calls, so every test gets its own copy of a
+session-wide spec'd template (``copy.deepcopy`` gives each copy independent
+child mocks, whereas ``copy.copy`` would share them and leak call counts).
+
+When /dev/shm is a writable tmpfs with room to spare, each run's temp dirs are
+placed there (see ``pytest_configure``) so pod files never leave memory.
+"""
+
+import copy
+import os
+import re
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+
+import orjson
+import pytest
+
+from src.components.feedback_manager import FeedbackManager
+from src.components.instruction_manager import InstructionManager
+from src.components.llm_provider import LLMProvider
+from src.components.requirement_comparator import RequirementComparator
+from src.components.result_manager import ResultManager
+from src.components.worker_executor import WorkerExecutor
+
+_TMPFS_ROOT = "/dev/shm"
+
+# Below this much free space the tmpfs is left alone (container /dev/shm is
+# often only 64 MB)
+_TMPFS_MIN_FREE_BYTES = 256 * 1024 * 1024
+
+# This run's tmpfs basetemp, removed again in pytest_unconfigure
+_TMPFS_BASETEMP = pytest.StashKey[str]()
+
+
+def _tmpfs_free_bytes() -> int:
+    """Free bytes on the tmpfs root, or 0 if it cannot be queried."""
+    try:
+        stat = os.statvfs(_TMPFS_ROOT)
+    except (AttributeError, OSError):
+        return 0
+    return stat.f_bavail * stat.f_frsize
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Place this run's tmp_path/tmp_path_factory dirs on tmpfs when it has room.
+
+    Goes through pytest's own ``--basetemp`` option (before the tmpdir plugin
+    reads it), so nothing leaks into the environment of subprocesses or later
+    sessions. Each run gets its own directory, removed at unconfigure, so runs
+    do not pile up in RAM. An explicit --basetemp always wins; xdist workers
+    inherit the controller's.
+    """
+    if config.option.basetemp or hasattr(config, "workerinput"):
+        return
+    if not (os.path.isdir(_TMPFS_ROOT) and os.access(_TMPFS_ROOT, os.W_OK)):
+        return
+    if _tmpfs_free_bytes() < _TMPFS_MIN_FREE_BYTES:
+        return
+    basetemp = os.path.join(_TMPFS_ROOT, f"lela-ai-pytest-{os.getpid()}")
+    config.option.basetemp = basetemp
+    config.stash[_TMPFS_BASETEMP] = basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the tmpfs basetemp set up by pytest_configure, freeing its memory."""
+    basetemp = config.stash.get(_TMPFS_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_log_level():
+    """Ignore the shell's LOG_LEVEL so Logger output does not depend on it.
+
+    Tests exercising LOG_LEVEL set it themselves via monkeypatch. A private
+    MonkeyPatch (not the ``monkeypatch`` fixture) keeps a test's own patches,
+    e.g. of os.unlink, from outliving its other fixtures' teardown.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("LOG_LEVEL", raising=False)
+        yield
+
+
+def _load_json(path):
+    """Read and parse a JSON file with a single buffered read."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+@pytest.fixture(scope="session")
+def load_json():
+    """Helper for asserting on JSON files written by components."""
+    return _load_json
+
+
+@pytest.fixture
+def pod_root(tmp_path_factory, request):
+    """Per-test directory allocated under the session's shared base temp dir."""
+    return tmp_path_factory.mktemp(re.sub(r"\W", "_", request.node.name)[:30], numbered=True)
+
+
+@pytest.fixture(scope="session")
+def path_only_root(tmp_path_factory):
+    """Session-wide directory for tests that only need paths, never files.
+
+    Nothing is created beneath it, so paths under it are guaranteed missing.
+    """
+    return tmp_path_factory.mktemp("path_only")
+
+
+@pytest.fixture(scope="session")
+def llm_config_path(tmp_path_factory):
+    """Session-wide llm_config.json shared by tests that only need a valid config."""
+    path = tmp_path_factory.mktemp("cfg") / "llm_config.json"
+    path.write_bytes(orjson.dumps({"model": "gpt-4", "temperature": 0.7}))
+    return path
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory, request):
+    """One temp dir per test class; tests carve named subdirs out of it."""
+    return tmp_path_factory.mktemp(re.sub(r"\W", "_", request.node.name)[:30], numbered=True)
+
+
+@pytest.fixture(scope="session")
+def _golden_payloads(tmp_path_factory):
+    """Session-wide "golden" files, one per distinct payload, written on first use."""
+    root = tmp_path_factory.mktemp("golden")
+    files = {}
+
+    def _get(payload):
+        path = files.get(payload)
+        if path is None:
+            path = root / f"{len(files)}.json"
+            path.write_bytes(payload)
+            files[payload] = path
+        return path
+
+    return _get
+
+
+@pytest.fixture
+def pod_factory(class_tmp, request, _golden_payloads):
+    """Factory creating a fresh pod dir from pre-serialized file payloads.
+
+    ``make(name, instructions_bytes=None, result_bytes=None)`` creates
+    ``<class_tmp>/<test name>_<name>`` with a single mkdir and places
+    instructions.json/result.json only for the payloads given.
+
+    Payload files are hard links to the golden copies (one link() instead of
+    open/write/close), so pods must treat them as read-only; filesystems
+    without hard links fall back to writing the bytes.
+    """
+    prefix = re.sub(r"\W", "_", request.node.name)
+
+    def _place(payload, dst):
+        try:
+            os.link(_golden_payloads(payload), dst)
+        except OSError:
+            dst.write_bytes(payload)
+
+    def _make(name, instructions_bytes=None, result_bytes=None):
+        pod_dir = class_tmp / f"{prefix}_{name}"
+        pod_dir.mkdir()
+        if instructions_bytes is not None:
+            _place(instructions_bytes, pod_dir / "instructions.json")
+        if result_bytes is not None:
+            _place(result_bytes, pod_dir / "result.json")
+        return pod_dir
+
+    return _make
+
+
+@pytest.fixture
+def make_pod(pod_root):
+    """Factory creating ``<pod_root>/<pod_id>/workers/<worker_id>`` layouts."""
+
+    def _make(pod_id, worker_ids=()):
+        workers_dir = pod_root / pod_id / "workers"
+        workers_dir.mkdir(parents=True, exist_ok=True)
+        for worker_id in worker_ids:
+            (workers_dir / worker_id).mkdir(exist_ok=True)
+        return pod_root / pod_id
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def instruction_mgr():
+    """Session-wide InstructionManager instance."""
+    return InstructionManager()
+
+
+@pytest.fixture(scope="session")
+def result_mgr():
+    """Session-wide ResultManager instance."""
+    return ResultManager()
+
+
+@pytest.fixture(scope="session")
+def feedback_mgr():
+    """Session-wide FeedbackManager instance."""
+    return FeedbackManager()
+
+
+@pytest.fixture(scope="session")
+def comparator():
+    """Session-wide RequirementComparator instance."""
+    return RequirementComparator()
+
+
+@pytest.fixture(scope="session")
+def _llm_mock_template():
+    """Spec'd LLMProvider mock template; generate() returns "PASS" by default."""
+    template = Mock(spec=LLMProvider)
+    template.generate.return_value = "PASS"
+    return template
+
+
+@pytest.fixture(scope="session")
+def _result_mgr_mock_template():
+    """Spec'd ResultManager mock template."""
+    return Mock(spec=ResultManager)
+
+
+@pytest.fixture
+def llm_mock(_llm_mock_template):
+    """Per-test LLMProvider mock with fresh call history."""
+    return copy.deepcopy(_llm_mock_template)
+
+
+@pytest.fixture
+def result_mgr_mock(_result_mgr_mock_template):
+    """Per-test ResultManager mock with fresh call history."""
+    return copy.deepcopy(_result_mgr_mock_template)
+
+
+@pytest.fixture(scope="session")
+def _worker_executor_prototype():
+    """WorkerExecutor (and its LLMProvider/ResultManager/Logger) built once per session."""
+    return WorkerExecutor()
+
+
+@pytest.fixture
+def executor(_worker_executor_prototype, llm_mock, result_mgr_mock):
+    """Per-test WorkerExecutor wired to the per-test ``llm_mock``/``result_mgr_mock``.
+
+    A shallow copy of the session prototype: only the mocked collaborators are
+    replaced, the stateless logger is shared.
+    """
+    executor = copy.copy(_worker_executor_prototype)
+    executor.llm_provider = llm_mock
+    executor.result_manager = result_mgr_mock
+    return executor
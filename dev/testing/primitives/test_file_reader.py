@@ -131,3 +131,29 @@ class TestFileReader:
 
         # Expected: Returns False when file doesn't exist
         assert reader.exists(str(non_existent_file)) is False
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"value": NaN, "high": Infinity, "low": -Infinity}',
+            '{"wide": 123456789012345678901234567890, "neg": -18446744073709551616}',
+            '{"lone": "\\ud800"}',
+            '{"plain": [1, 2.5, "x", null, true]}',
+        ],
+    )
+    def test_read_matches_stdlib_json(self, tmp_path, text):
+        """
+        read() accepts what json.loads accepts, with the same values: non-finite
+        numbers parse and integers wider than 64 bits keep full precision
+        """
+        # Setup
+        test_file = tmp_path / "lenient.json"
+        test_file.write_text(text, encoding="utf-8")
+
+        # Action
+        from src.primitives.file_reader import FileReader
+        reader = FileReader()
+        result = reader.read(str(test_file))
+
+        # Expected: same result as the stdlib (NaN compared via repr)
+        assert repr(result) == repr(json.loads(text))
@@ -13,6 +13,7 @@ Total: 17 test cases mapped 1:1 to acceptance criteria
 Requirements tested: Issue #10 acceptance criteria
 """
 
+import fcntl
 import json
 import os
 import tempfile
@@ -291,6 +292,36 @@ class TestWriteAtomic:
             content = json.load(f)
         assert content == test_data, "Unicode preserved correctly"
 
+    # TC3.6: Values orjson cannot write as json.dump did
+    def test_write_atomic_round_trips_non_finite_floats(self, writer, temp_dir):
+        """Verify NaN/Infinity are written as json.dump writes them, not as null."""
+        target_file = temp_dir / "non_finite.json"
+        test_data = {"nan": float("nan"), "inf": float("inf"), "neg": [float("-inf")]}
+
+        # Act
+        writer.write_atomic(str(target_file), test_data)
+
+        # Assert
+        raw_content = target_file.read_text(encoding="utf-8")
+        assert raw_content == json.dumps(test_data, ensure_ascii=False, indent=2)
+        content = json.loads(raw_content)
+        assert content["nan"] != content["nan"]
+        assert content["inf"] == float("inf")
+        assert content["neg"] == [float("-inf")]
+
+    def test_write_atomic_handles_integers_wider_than_64_bits(self, writer, temp_dir):
+        """Verify integers beyond 64 bits are written exactly instead of raising."""
+        target_file = temp_dir / "wide.json"
+        test_data = {"wide": 2**70, "neg": -(2**64)}
+
+        # Act
+        writer.write_atomic(str(target_file), test_data)
+
+        # Assert
+        with open(target_file, "r", encoding="utf-8") as f:
+            content = json.load(f)
+        assert content == test_data
+
 
 class TestWriteWithLock:
     """Test write_with_lock() method for concurrent write safety."""
@@ -375,22 +406,40 @@ class TestWriteWithLock:
             content = json.load(f)
         assert content == {"second": "write"}, "Second write should overwrite"
 
+    def test_write_bytes_with_lock_writes_payload_verbatim(self, writer, temp_dir):
+        """Verify pre-encoded bytes are written unchanged, replacing old content."""
+        target_file = temp_dir / "nested" / "locked.json"
+        writer.write_with_lock(str(target_file), {"old": "content that is longer"})
+        payload = b'{"new": true}'
+
+        # Act
+        result = writer.write_bytes_with_lock(str(target_file), payload)
+
+        # Assert
+        assert result is True
+        assert target_file.read_bytes() == payload
+
     # TC5.1: Releases lock on failure
     def test_write_with_lock_releases_lock_on_failure(self, writer, temp_dir, monkeypatch):
         """Verify lock released even if write fails."""
         target_file = temp_dir / "locked.json"
 
-        # Force write to fail
-        def failing_dump(*args, **kwargs):
-            raise ValueError("Simulated serialization error")
+        # Force the write to fail while the exclusive lock is held
+        # (serialization happens before locking, so fail right after acquiring)
+        real_flock = fcntl.flock
+
+        def flock_then_fail(fd, operation):
+            real_flock(fd, operation)
+            if operation == fcntl.LOCK_EX:
+                raise ValueError("Simulated write error")
 
-        monkeypatch.setattr(json, "dump", failing_dump)
+        monkeypatch.setattr(fcntl, "flock", flock_then_fail)
 
         # Act - First write fails
-        with pytest.raises(ValueError, match="Simulated serialization error"):
+        with pytest.raises(ValueError, match="Simulated write error"):
             writer.write_with_lock(str(target_file), {"data": "test"})
 
-        # Restore normal json.dump
+        # Restore normal fcntl.flock
         monkeypatch.undo()
 
         # Act - Second write should succeed (lock was released)
@@ -486,6 +535,33 @@ class TestBasicWrite:
             content = json.load(f)
         assert content == test_data
 
+    def test_write_bytes_creates_parent_dirs_and_writes_verbatim(self, writer, temp_dir):
+        """Verify write_bytes() writes pre-encoded bytes unchanged."""
+        target_file = temp_dir / "nested" / "test.json"
+        payload = b'{"key": "value"}'
+
+        # Act
+        result = writer.write_bytes(str(target_file), payload)
+
+        # Assert
+        assert result is True
+        assert target_file.read_bytes() == payload
+
+    def test_write_bytes_atomic_replaces_file_verbatim(self, writer, temp_dir):
+        """Verify write_bytes_atomic() swaps in the payload and leaves no temp file."""
+        target_file = temp_dir / "nested" / "test.json"
+        target_file.parent.mkdir()
+        target_file.write_bytes(b'{"old": true}')
+        payload = b'{"key": "value"}'
+
+        # Act
+        result = writer.write_bytes_atomic(str(target_file), payload)
+
+        # Assert
+        assert result is True
+        assert target_file.read_bytes() == payload
+        assert list(target_file.parent.iterdir()) == [target_file]
+
     def test_write_handles_permission_error(self, writer, temp_dir):
         """Verify write() raises PermissionError when cannot write."""
         # Create read-only directory
@@ -227,6 +227,30 @@ class TestGapExtractor:
         assert len(requirements) == 3, f"Expected 3 requirements, got {len(requirements)}"
         assert all(req.strip() for req in requirements), "All requirements should be non-empty"
 
+    def test_analyze_matches_extract_requirements_then_find_gaps(self):
+        """
+        Verify analyze() returns the same gaps as extract_requirements() + find_gaps()
+
+        The single-pass path must not change which requirements are reported
+        """
+        from src.primitives.gap_extractor import GapExtractor
+
+        extractor = GapExtractor()
+
+        instructions = """
+        1. Calculate sum of 2+2
+
+        2. Return result as integer
+        3. Explain the method
+        """
+
+        for result in ["The sum is 4", "4", "method: add", ""]:
+            expected = extractor.find_gaps(extractor.extract_requirements(instructions), result)
+            assert extractor.analyze(instructions, result) == expected
+
+        # No requirements means no gaps
+        assert extractor.analyze("  \n ", "anything") == []
+
     def test_has_integer_format_detects_pure_numbers(self):
         """
         Verify _has_integer_format() returns True for pure integer strings
@@ -6,6 +6,8 @@ Covers validation of instructions, results, and feedback schemas used in pod com
 """
 
 import pytest
+from unittest.mock import patch
+
 from src.primitives.json_validator import JSONValidator
 
 
@@ -203,6 +205,18 @@ class TestResultSchema:
 
         assert is_valid is True
 
+    def test_predefined_schemas_use_precompiled_validators(self):
+        """Predefined schema validation does not compile a new Draft7Validator per call"""
+        validator = JSONValidator()
+
+        with patch("src.primitives.json_validator.Draft7Validator") as mock_compile:
+            validator.validate_instructions({"instructions": "x", "output_path": "y"})
+            validator.validate_result({"result": "done"})
+            validator.validate_feedback({"status": "PASS", "result": "ok", "attempts": 1})
+            validator.validate_feedback({"status": "FAIL", "gaps": ["gap"], "attempt": 1})
+
+        mock_compile.assert_not_called()
+
 
 class TestFeedbackSchemas:
     """Tests for validate_feedback() using FEEDBACK_PASS_SCHEMA and FEEDBACK_FAIL_SCHEMA"""
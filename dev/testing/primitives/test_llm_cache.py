@@ -0,0 +1,119 @@
+"""
+Test suite for LLMCache primitive
+
+Covers cache keys, hit/miss statistics, TTL expiry and backend operations.
+"""
+
+from src.primitives.llm_cache import LLMCache, MemoryCacheBackend
+
+
+class TestLLMCacheKey:
+    """Test cache key construction."""
+
+    def test_cache_key_is_stable_sha256_hex(self):
+        """Same provider and prompt always map to the same 64-char hex key."""
+        key = LLMCache.cache_key("openai", "Calculate 2+2")
+
+        assert key == LLMCache.cache_key("openai", "Calculate 2+2")
+        assert len(key) == 64
+        int(key, 16)
+
+    def test_cache_key_differs_by_provider_and_prompt(self):
+        """Provider and prompt both contribute to the key."""
+        base = LLMCache.cache_key("openai", "Calculate 2+2")
+
+        assert LLMCache.cache_key("anthropic", "Calculate 2+2") != base
+        assert LLMCache.cache_key("openai", "Calculate 2+3") != base
+
+
+class TestLLMCacheLookup:
+    """Test get/set behavior and statistics."""
+
+    def test_miss_then_hit_updates_stats(self):
+        """First lookup misses, lookup after set() hits with the stored response."""
+        cache = LLMCache()
+
+        assert cache.get("mock", "prompt") is None
+        cache.set("mock", "prompt", {"result": "42"})
+
+        assert cache.get("mock", "prompt") == {"result": "42"}
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_mutating_responses_does_not_change_cached_value(self):
+        """Responses handed to set() or returned by get() are not the cached object."""
+        cache = LLMCache()
+        response = {"result": "42", "usage": {"tokens": 3}}
+        cache.set("mock", "prompt", response)
+        response["result"] = "changed after set"
+
+        first = cache.get("mock", "prompt")
+        first["result"] = "changed by caller"
+        first["usage"]["tokens"] = 0
+
+        assert cache.get("mock", "prompt") == {"result": "42", "usage": {"tokens": 3}}
+
+    def test_clear_removes_entries_and_resets_stats(self):
+        """clear() empties the backend and zeroes statistics."""
+        cache = LLMCache()
+        cache.set("mock", "prompt", {"result": "42"})
+        cache.get("mock", "prompt")
+
+        cache.clear()
+
+        assert cache.stats == {"hits": 0, "misses": 0}
+        assert cache.get("mock", "prompt") is None
+
+    def test_ttl_expires_entries(self, monkeypatch):
+        """Entries older than the TTL are treated as misses and evicted."""
+        now = [1000.0]
+        monkeypatch.setattr("src.primitives.llm_cache.time.monotonic", lambda: now[0])
+        backend = MemoryCacheBackend()
+        cache = LLMCache(backend=backend, ttl=10)
+        cache.set("mock", "prompt", {"result": "42"})
+
+        now[0] += 5
+        assert cache.get("mock", "prompt") == {"result": "42"}
+
+        now[0] += 5
+        assert cache.get("mock", "prompt") is None
+        assert backend._store == {}
+
+
+class TestMemoryCacheBackend:
+    """Test the in-memory backend directly."""
+
+    def test_delete_removes_key_and_ignores_missing(self):
+        """delete() removes a stored key and is a no-op for unknown keys."""
+        backend = MemoryCacheBackend()
+        backend.set("k", {"result": "v"})
+
+        backend.delete("k")
+        backend.delete("missing")
+
+        assert backend.get("k") is None
+
+    def test_evicts_least_recently_used_beyond_maxsize(self):
+        """Beyond maxsize the least recently used key is dropped; get() refreshes a key."""
+        backend = MemoryCacheBackend(maxsize=2)
+        backend.set("a", {"result": "1"})
+        backend.set("b", {"result": "2"})
+        backend.get("a")
+
+        backend.set("c", {"result": "3"})
+
+        assert backend.get("b") is None
+        assert backend.get("a") == {"result": "1"}
+        assert backend.get("c") == {"result": "3"}
+
+    def test_set_purges_expired_entries(self, monkeypatch):
+        """Expired entries are dropped on the next set(), even if never looked up again."""
+        now = [1000.0]
+        monkeypatch.setattr("src.primitives.llm_cache.time.monotonic", lambda: now[0])
+        backend = MemoryCacheBackend()
+        backend.set("old", {"result": "1"}, ttl=10)
+        backend.set("forever", {"result": "2"})
+
+        now[0] += 10
+        backend.set("new", {"result": "3"}, ttl=10)
+
+        assert list(backend._store) == ["forever", "new"]
@@ -285,3 +285,82 @@ class TestLogger:
             assert re.search(
                 iso8601_pattern, line
             ), f"Corrupted log line (missing timestamp): {line[:100]}"
+
+    def test_filters_messages_below_min_level(self, capsys):
+        """
+        Messages below the configured level are dropped
+
+        Verifies is_enabled_for() agrees with what is actually written
+        """
+        from src.primitives.logger import Logger
+
+        logger = Logger(level="warning")
+
+        logger.info("dropped info")
+        logger.warning("kept warning")
+
+        output = capsys.readouterr().out
+        assert "dropped info" not in output
+        assert "kept warning" in output
+        assert logger.is_enabled_for("info") is False
+        assert logger.is_enabled_for("warning") is True
+        assert logger.is_enabled_for("error") is True
+
+    def test_level_defaults_to_log_level_env(self, monkeypatch):
+        """
+        LOG_LEVEL sets the level when none is passed; unset means everything is logged
+        """
+        from src.primitives.logger import Logger
+
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        assert Logger().is_enabled_for("debug") is True
+
+        monkeypatch.setenv("LOG_LEVEL", "ERROR")
+        assert Logger().is_enabled_for("warning") is False
+        assert Logger(level="info").is_enabled_for("info") is True
+
+    def test_rejects_unknown_level(self):
+        """
+        An unknown level name raises ValueError
+        """
+        from src.primitives.logger import Logger
+
+        with pytest.raises(ValueError, match="verbose"):
+            Logger(level="verbose")
+        with pytest.raises(ValueError, match="verbose"):
+            Logger().is_enabled_for("verbose")
+
+    @pytest.mark.parametrize(
+        ("env_level", "warning_enabled", "error_enabled"),
+        [
+            ("WARN", True, True),
+            ("critical", False, False),
+            ("fatal", False, False),
+            ("", True, True),
+        ],
+    )
+    def test_log_level_env_aliases(self, monkeypatch, env_level, warning_enabled, error_enabled):
+        """
+        LOG_LEVEL accepts stdlib aliases; an empty value counts as unset
+        """
+        from src.primitives.logger import Logger
+
+        monkeypatch.setenv("LOG_LEVEL", env_level)
+        logger = Logger()
+
+        assert logger.is_enabled_for("warning") is warning_enabled
+        assert logger.is_enabled_for("error") is error_enabled
+        assert logger.is_enabled_for("critical") is True
+
+    def test_unknown_log_level_env_warns_and_logs_everything(self, monkeypatch):
+        """
+        An unknown LOG_LEVEL warns instead of breaking construction
+        """
+        from src.primitives.logger import Logger
+
+        monkeypatch.setenv("LOG_LEVEL", "verbose")
+
+        with pytest.warns(RuntimeWarning, match="verbose"):
+            logger = Logger()
+
+        assert logger.is_enabled_for("debug") is True
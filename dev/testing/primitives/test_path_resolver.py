@@ -118,6 +118,125 @@ class TestPathResolver:
         assert not (detected_root / "pyproject.toml").exists()
         assert not (detected_root / "package.json").exists()
 
+    def test_get_project_root_cache_stays_bounded(self, tmp_path, monkeypatch):
+        """
+        The per-directory root cache evicts old entries instead of growing with
+        every pod directory looked up.
+        """
+        # Arrange
+        from src.primitives import path_resolver
+
+        monkeypatch.setattr(path_resolver, "_ROOT_CACHE_SIZE", 8)
+        project_root = tmp_path / "project"
+        (project_root / ".git").mkdir(parents=True)
+        pods = [project_root / "pods" / f"pod-{i}" for i in range(20)]
+        for pod in pods:
+            pod.mkdir(parents=True)
+
+        resolver = path_resolver.PathResolver()
+
+        # Act
+        roots = [resolver.get_project_root(pod) for pod in pods]
+
+        # Assert
+        assert roots == [project_root] * len(pods)
+        assert len(resolver._root_cache) <= 8
+
+    def test_get_project_root_is_thread_safe_past_cache_size(self, tmp_path, monkeypatch):
+        """
+        Concurrent lookups that keep evicting cache entries all resolve the
+        shared project root without errors.
+        """
+        # Arrange
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.primitives import path_resolver
+
+        monkeypatch.setattr(path_resolver, "_ROOT_CACHE_SIZE", 8)
+        project_root = tmp_path / "project"
+        (project_root / ".git").mkdir(parents=True)
+        pods = [project_root / "pods" / f"pod-{i}" / "workers" for i in range(64)]
+        for pod in pods:
+            pod.mkdir(parents=True)
+
+        resolver = path_resolver.PathResolver()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            roots = list(executor.map(resolver.get_project_root, pods * 8))
+
+        # Assert
+        assert roots == [project_root] * len(pods) * 8
+        assert len(resolver._root_cache) <= 8
+
+    def test_get_project_root_reuses_walk_for_sibling_directories(self, tmp_path, monkeypatch):
+        """
+        Sibling pods share ancestors: the second lookup only probes the new pod
+        directory itself, and the no-marker fallback stays per start_path.
+        """
+        # Arrange
+        from pathlib import Path
+
+        from src.primitives.path_resolver import PathResolver
+
+        project_root = tmp_path / "project"
+        (project_root / ".git").mkdir(parents=True)
+        pods_dir = project_root / "sessions" / "pods"
+        pod_a = pods_dir / "pod-a"
+        pod_b = pods_dir / "pod-b"
+        pod_a.mkdir(parents=True)
+        pod_b.mkdir()
+        no_marker_a = tmp_path / "elsewhere" / "a"
+        no_marker_b = tmp_path / "elsewhere" / "b"
+        no_marker_a.mkdir(parents=True)
+        no_marker_b.mkdir()
+
+        resolver = PathResolver()
+        assert resolver.get_project_root(pod_a) == project_root
+
+        probed = []
+        exists = Path.exists
+
+        def _counting_exists(path):
+            probed.append(path.parent)
+            return exists(path)
+
+        monkeypatch.setattr(Path, "exists", _counting_exists)
+
+        # Act
+        root_b = resolver.get_project_root(pod_b)
+
+        # Assert
+        assert root_b == project_root
+        assert set(probed) == {pod_b}
+
+        # Fallback results are not shared between siblings
+        monkeypatch.setattr(Path, "exists", exists)
+        assert resolver.get_project_root(no_marker_a) == no_marker_a
+        assert resolver.get_project_root(no_marker_b) == no_marker_b
+
+    def test_get_project_root_finds_marker_created_after_a_miss(self, tmp_path):
+        """
+        A lookup that found no marker is not cached, so a marker created later
+        is detected by the same resolver.
+        """
+        # Arrange
+        from src.primitives.path_resolver import PathResolver
+
+        project_root = tmp_path / "late-project"
+        pod_dir = project_root / "pods" / "pod-1"
+        pod_dir.mkdir(parents=True)
+
+        resolver = PathResolver()
+        assert resolver.get_project_root(pod_dir) == pod_dir
+
+        # Act
+        (project_root / "pyproject.toml").touch()
+        detected_root = resolver.get_project_root(pod_dir)
+
+        # Assert
+        assert detected_root == project_root
+
     def test_create_session_dir_creates_unique_directory_with_timestamp(self, tmp_path):
         """
         AC3: Creates session directory with unique name (agent-name + session-id + timestamp)
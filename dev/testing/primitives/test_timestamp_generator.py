@@ -50,6 +50,23 @@ class TestTimestampGenerator:
             before_call <= parsed_time <= after_call
         ), f"Timestamp {parsed_time} is not within current time range"
 
+    def test_now_keeps_microseconds_when_zero(self, monkeypatch):
+        """
+        now() always includes the .ffffff fraction, even on a whole second.
+        """
+        # Setup: Freeze the clock on an exact second
+        frozen = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen
+
+        monkeypatch.setattr("src.primitives.timestamp_generator.datetime", _FrozenDatetime)
+
+        # Action & Expected
+        assert TimestampGenerator.now() == "2024-01-02T03:04:05.000000Z"
+
     def test_now_always_returns_utc_timezone(self):
         """
         Test 2: Always uses UTC timezone
@@ -16,11 +16,17 @@ Test Coverage:
 """
 
 import json
+import orjson
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 
+def _write_json(path, obj):
+    """Write obj as compact JSON bytes (no str round-trip or newline translation)."""
+    path.write_bytes(orjson.dumps(obj))
+
+
 class TestFeedbackLoopBasicFlow:
     """Test basic feedback loop execution flow"""
 
@@ -77,10 +83,10 @@ class TestFeedbackLoopExecution:
 
         # Setup: Write instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Return the number 42",
             "output_path": "result.json"
-        }))
+        })
 
         # Mock both worker and supervisor
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker, \
@@ -117,10 +123,10 @@ class TestFeedbackLoopExecution:
 
         # Setup instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Return the number 42",
             "output_path": "result.json"
-        }))
+        })
 
         # Mock both worker and supervisor
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker, \
@@ -141,11 +147,11 @@ class TestFeedbackLoopExecution:
 
             # Write feedback file for retry (simulate supervisor writing gaps)
             feedback_file = tmp_path / "feedback.json"
-            feedback_file.write_text(json.dumps({
+            _write_json(feedback_file, {
                 "status": "FAIL",
                 "gaps": ["Result was 24, expected 42"],
                 "attempt": 1
-            }))
+            })
 
             result = loop.run()
 
@@ -171,10 +177,10 @@ class TestFeedbackLoopExecution:
 
         # Setup instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Return the number 42",
             "output_path": "result.json"
-        }))
+        })
 
         # Mock worker to always fail
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker:
@@ -205,10 +211,10 @@ class TestFeedbackLoopGapsContext:
 
         # Setup instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Return JSON with 'name' and 'age' keys",
             "output_path": "result.json"
-        }))
+        })
 
         # Mock supervisor to write FAIL feedback with gaps
         with patch('src.features.feedback_loop.SupervisorEvaluation') as MockSupervisor:
@@ -219,11 +225,11 @@ class TestFeedbackLoopGapsContext:
 
             # Simulate supervisor writing feedback.json
             feedback_file = tmp_path / "feedback.json"
-            feedback_file.write_text(json.dumps({
+            _write_json(feedback_file, {
                 "status": "FAIL",
                 "gaps": ["Missing 'age' key", "Value type mismatch"],
                 "attempt": 1
-            }))
+            })
 
             loop = FeedbackLoop(pod_dir=tmp_path, pod_id="test-pod-001")
 
@@ -237,17 +243,17 @@ class TestFeedbackLoopGapsContext:
 
         # Setup
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Return valid JSON",
             "output_path": "result.json"
-        }))
+        })
 
         feedback_file = tmp_path / "feedback.json"
-        feedback_file.write_text(json.dumps({
+        _write_json(feedback_file, {
             "status": "FAIL",
             "gaps": ["Missing required field 'id'", "Invalid JSON format"],
             "attempt": 1
-        }))
+        })
 
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker:
             mock_worker = MockWorker.return_value
@@ -271,10 +277,10 @@ class TestFeedbackLoopHistory:
 
         # Setup instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Test instructions",
             "output_path": "result.json"
-        }))
+        })
 
         # Create loop with mocked components
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker, \
@@ -349,10 +355,10 @@ class TestFeedbackLoopErrorHandling:
         from src.features.feedback_loop import FeedbackLoop
 
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Long running task",
             "output_path": "result.json"
-        }))
+        })
 
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker:
             mock_worker = MockWorker.return_value
@@ -374,10 +380,10 @@ class TestFeedbackLoopErrorHandling:
         from src.features.feedback_loop import FeedbackLoop
 
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Test task",
             "output_path": "result.json"
-        }))
+        })
 
         with patch('src.features.feedback_loop.SupervisorEvaluation') as MockSupervisor:
             mock_supervisor = MockSupervisor.return_value
@@ -410,10 +416,10 @@ class TestFeedbackLoopLogging:
         from src.features.feedback_loop import FeedbackLoop
 
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Test",
             "output_path": "result.json"
-        }))
+        })
 
         with patch('src.features.feedback_loop.Logger') as MockLogger:
             mock_logger = MockLogger.return_value
@@ -475,10 +481,10 @@ class TestFeedbackLoopIntegration:
 
         # Setup instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Return the word 'SUCCESS'",
             "output_path": "result.json"
-        }))
+        })
 
         # Create feedback loop with real components
         loop = FeedbackLoop(
@@ -503,10 +509,10 @@ class TestFeedbackLoopIntegration:
         from src.features.feedback_loop import FeedbackLoop
 
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Test file-based communication",
             "output_path": "result.json"
-        }))
+        })
 
         loop = FeedbackLoop(pod_dir=tmp_path, pod_id="test-pod-001")
 
@@ -539,10 +545,10 @@ class TestFeedbackLoopEdgeCases:
 
         # Create PASS feedback
         feedback_file = tmp_path / "feedback.json"
-        feedback_file.write_text(json.dumps({
+        _write_json(feedback_file, {
             "status": "PASS",
             "attempt": 1
-        }))
+        })
 
         loop = FeedbackLoop(pod_dir=tmp_path, pod_id="test-pod-001")
         gaps = loop._read_gaps()
@@ -574,10 +580,10 @@ class TestFeedbackLoopEdgeCases:
 
         # Setup instructions
         instructions_file = tmp_path / "instructions.json"
-        instructions_file.write_text(json.dumps({
+        _write_json(instructions_file, {
             "instructions": "Test",
             "output_path": "result.json"
-        }))
+        })
 
         with patch('src.features.feedback_loop.WorkerExecution') as MockWorker:
             mock_worker = MockWorker.return_value
@@ -14,34 +14,33 @@ Dependencies: All 6 components (#12-#17) and primitives (#1-#10)
 Stack: Python + pytest + pytest-mock
 """
 
-import json
+import orjson
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
-
-# Sprint 2 Components under integration test
-from src.components.instruction_manager import InstructionManager
-from src.components.result_manager import ResultManager
-from src.components.feedback_manager import FeedbackManager
-from src.components.llm_provider import LLMProvider
-from src.components.requirement_comparator import RequirementComparator
+
 from src.components.worker_executor import WorkerExecutor
 
 
+class _FakeLLMProvider:
+    """Plain LLMProvider stand-in; the binary evaluator passes on "PASS"."""
+
+    def generate(self, *args, **kwargs):
+        return "PASS"
+
+
 class TestInstructionResultManagerIntegration:
     """Test InstructionManager + ResultManager integration."""
 
-    def test_pod_workflow_instruction_creation_and_result_aggregation(self, tmp_path):
+    def test_pod_workflow_instruction_creation_and_result_aggregation(
+        self, make_pod, instruction_mgr, result_mgr
+    ):
         """Complete workflow: Create instructions → Workers execute → Aggregate results.
 
         Tests: InstructionManager.create() integrates with ResultManager.aggregate_worker_results()
         """
         # Arrange: Create pod structure
-        pod_dir = tmp_path / "pod-integration-test"
-        pod_dir.mkdir()
-
-        instruction_mgr = InstructionManager()
-        result_mgr = ResultManager()
+        worker_ids = ["worker-001", "worker-002", "worker-003"]
+        pod_dir = make_pod("pod-integration-test", worker_ids)
 
         # Act Phase 1: Supervisor creates instructions for pod
         instructions_file = instruction_mgr.create(
@@ -55,14 +54,10 @@ class TestInstructionResultManagerIntegration:
         assert (pod_dir / "instructions.json").exists()
 
         # Act Phase 2: Simulate 3 workers executing and producing results
-        worker_ids = ["worker-001", "worker-002", "worker-003"]
         for worker_id in worker_ids:
-            worker_dir = pod_dir / "workers" / worker_id
-            worker_dir.mkdir(parents=True)
-
             result_mgr.write(
                 result=f"{worker_id} completed analysis",
-                worker_dir=worker_dir,
+                worker_dir=pod_dir / "workers" / worker_id,
                 worker_id=worker_id,
                 pod_id="pod-integration-test",
                 session_id="session-int-001",
@@ -80,18 +75,17 @@ class TestInstructionResultManagerIntegration:
 class TestRequirementComparatorFeedbackManagerIntegration:
     """Test RequirementComparator + FeedbackManager integration."""
 
-    def test_evaluation_fail_writes_feedback_with_gaps(self, tmp_path):
+    def test_evaluation_fail_writes_feedback_with_gaps(
+        self, pod_root, comparator, feedback_mgr, load_json
+    ):
         """Supervisor evaluates result → Writes FAIL feedback with gaps.
 
         Tests: RequirementComparator.evaluate() → FeedbackManager.write_fail()
         """
         # Arrange
-        pod_dir = tmp_path / "pod-eval-fail"
+        pod_dir = pod_root / "pod-eval-fail"
         pod_dir.mkdir()
 
-        comparator = RequirementComparator()
-        feedback_mgr = FeedbackManager()
-
         # Act: Evaluate incomplete result
         instructions = "Create report with 5 sections: intro, methods, results, discussion, conclusion"
         result = "Report with intro and methods only"
@@ -111,26 +105,24 @@ class TestRequirementComparatorFeedbackManagerIntegration:
 
         # Assert: Feedback file contains evaluation gaps
         assert Path(feedback_file).exists()
-        with open(feedback_file, "r") as f:
-            feedback_data = json.load(f)
+        feedback_data = load_json(feedback_file)
 
         assert feedback_data["status"] == "FAIL"
         assert feedback_data["attempt"] == 1
         assert len(feedback_data["gaps"]) > 0
         assert feedback_data["pod_id"] == "pod-eval-fail"
 
-    def test_evaluation_pass_writes_feedback_with_result(self, tmp_path):
+    def test_evaluation_pass_writes_feedback_with_result(
+        self, pod_root, comparator, feedback_mgr, load_json
+    ):
         """Supervisor evaluates result → Writes PASS feedback with result.
 
         Tests: RequirementComparator.evaluate() → FeedbackManager.write_pass()
         """
         # Arrange
-        pod_dir = tmp_path / "pod-eval-pass"
+        pod_dir = pod_root / "pod-eval-pass"
         pod_dir.mkdir()
 
-        comparator = RequirementComparator()
-        feedback_mgr = FeedbackManager()
-
         # Act: Evaluate PASS result (RequirementComparator expects "PASS" string)
         instructions = "Verify user authentication"
         result = "PASS"  # Binary evaluator - only "PASS" succeeds
@@ -150,8 +142,7 @@ class TestRequirementComparatorFeedbackManagerIntegration:
 
         # Assert: Feedback file contains PASS status
         assert Path(feedback_file).exists()
-        with open(feedback_file, "r") as f:
-            feedback_data = json.load(f)
+        feedback_data = load_json(feedback_file)
 
         assert feedback_data["status"] == "PASS"
         assert feedback_data["attempts"] == 2
@@ -161,45 +152,42 @@ class TestRequirementComparatorFeedbackManagerIntegration:
 class TestWorkerExecutorComponentIntegration:
     """Test WorkerExecutor integration with LLMProvider and ResultManager."""
 
-    @patch("src.components.worker_executor.LLMProvider")
-    @patch("src.components.worker_executor.ResultManager")
     def test_worker_executor_reads_instructions_calls_llm_writes_result(
-        self, mock_result_mgr_class, mock_llm_provider_class, tmp_path
+        self,
+        pod_root,
+        make_pod,
+        executor,
+        llm_config_path,
+        llm_mock,
+        result_mgr_mock,
     ):
         """WorkerExecutor orchestrates: Read instructions → Call LLM → Write result.
 
         Tests: WorkerExecutor integrates with LLMProvider and ResultManager
         """
-        # Arrange: Setup mocks
-        mock_llm_instance = Mock()
+        # Arrange: Setup mocks (``executor`` is wired to llm_mock/result_mgr_mock)
+        mock_llm_instance = llm_mock
         mock_llm_instance.generate.return_value = "Analysis: Dataset has 1000 rows, 10 columns"
-        mock_llm_provider_class.return_value = mock_llm_instance
 
-        mock_result_mgr_instance = Mock()
+        mock_result_mgr_instance = result_mgr_mock
         mock_result_mgr_instance.write.return_value = "/path/to/result.json"
-        mock_result_mgr_class.return_value = mock_result_mgr_instance
 
         # Create instructions file
-        worker_dir = tmp_path / "pod-worker-exec" / "workers" / "worker-001"
-        worker_dir.mkdir(parents=True)
+        pod_dir = make_pod("pod-worker-exec", ["worker-001"])
+        worker_dir = pod_dir / "workers" / "worker-001"
 
-        instructions_file = worker_dir.parent.parent / "instructions.json"
+        instructions_file = pod_dir / "instructions.json"
         instructions_data = {
             "instructions": "Analyze dataset",
             "output_path": "result.json",
             "pod_id": "pod-worker-exec",
             "session_id": "session-worker-001",
-            "project_root": str(tmp_path),
+            "project_root": str(pod_root),
             "timestamp": "2025-12-24T23:30:00Z",
         }
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        # Create mock LLM config file
-        llm_config_file = tmp_path / "llm_config.json"
-        llm_config_file.write_text(json.dumps({"model": "gpt-4", "temperature": 0.7}))
+        instructions_file.write_bytes(orjson.dumps(instructions_data))
 
         # Act: Execute worker task
-        executor = WorkerExecutor()
         result_path = executor.execute(
             instructions_path=str(instructions_file),
             worker_config={
@@ -207,7 +195,7 @@ class TestWorkerExecutorComponentIntegration:
                 "worker_dir": str(worker_dir),
                 "pod_id": "pod-worker-exec",
                 "session_id": "session-worker-001",
-                "llm_config_path": str(llm_config_file),
+                "llm_config_path": str(llm_config_path),
             },
         )
 
@@ -217,239 +205,185 @@ class TestWorkerExecutorComponentIntegration:
         assert result_path == "/path/to/result.json"
 
 
-class TestSupervisorWorkerFeedbackLoop:
-    """Test complete supervisor-worker feedback loop integration."""
-
-    def test_fail_retry_pass_workflow_all_components(self, tmp_path):
-        """Full workflow: Worker FAIL → Feedback → Worker RETRY → PASS.
+@pytest.fixture
+def pod_with_instructions(make_pod, instruction_mgr):
+    """Factory building a one-worker pod whose supervisor has written instructions.
 
-        Tests: InstructionManager + ResultManager + RequirementComparator + FeedbackManager
-        """
-        # Arrange: Setup pod
-        pod_dir = tmp_path / "pod-feedback-loop"
-        pod_dir.mkdir()
-        worker_dir = pod_dir / "workers" / "worker-001"
-        worker_dir.mkdir(parents=True)
+    Returns (pod_dir, worker_dir, instructions_file).
+    """
 
-        instruction_mgr = InstructionManager()
-        result_mgr = ResultManager()
-        comparator = RequirementComparator()
-        feedback_mgr = FeedbackManager()
-
-        # Phase 1: Supervisor creates instructions
+    def _create(pod_id, session_id, worker_id, instructions):
+        pod_dir = make_pod(pod_id, [worker_id])
         instructions_file = instruction_mgr.create(
-            instructions="Generate report with 3 sections",
+            instructions=instructions,
             pod_dir=pod_dir,
-            session_id="session-feedback-001",
+            session_id=session_id,
         )
+        assert Path(instructions_file).exists()
+        return pod_dir, pod_dir / "workers" / worker_id, instructions_file
+
+    return _create
+
+
+class TestPodLifecycleScenarios:
+    """Test complete supervisor-worker pod lifecycles across all components."""
 
-        # Phase 2: Worker attempt #1 - produces incomplete result
+    def test_fail_retry_pass_workflow_all_components(
+        self, pod_with_instructions, result_mgr, comparator, feedback_mgr, load_json
+    ):
+        """Worker FAIL → Feedback → Worker RETRY → PASS."""
+        # Arrange: Pod with supervisor instructions
+        pod_id = "pod-feedback-loop"
+        session_id = "session-feedback-001"
+        worker_id = "worker-001"
+        instructions = "Generate report with 3 sections"
+        pod_dir, worker_dir, _ = pod_with_instructions(pod_id, session_id, worker_id, instructions)
+
+        # Act: Worker attempt #1 - produces incomplete result
         result_mgr.write(
             result="Report with 2 sections",
             worker_dir=worker_dir,
-            worker_id="worker-001",
-            pod_id="pod-feedback-loop",
-            session_id="session-feedback-001",
+            worker_id=worker_id,
+            pod_id=pod_id,
+            session_id=session_id,
         )
 
-        # Phase 3: Supervisor evaluates → FAIL
+        # Supervisor evaluates → FAIL
         status_1, gaps_1 = comparator.evaluate(
-            instructions="Generate report with 3 sections",
+            instructions=instructions,
             result="Report with 2 sections",
         )
 
         assert status_1 == "FAIL"
         assert len(gaps_1) > 0
 
-        # Phase 4: Supervisor writes FAIL feedback
         feedback_file_1 = feedback_mgr.write_fail(
             gaps=gaps_1,
             attempt=1,
             pod_dir=pod_dir,
-            pod_id="pod-feedback-loop",
+            pod_id=pod_id,
         )
 
-        # Phase 5: Worker attempt #2 - reads feedback, produces correct result
+        # Worker attempt #2 - reads feedback, produces correct result
         # (In real system, worker reads feedback.json - here we simulate with "PASS")
         result_mgr.write(
             result="PASS",  # Binary evaluator expects "PASS" string
             worker_dir=worker_dir,
-            worker_id="worker-001",
-            pod_id="pod-feedback-loop",
-            session_id="session-feedback-001",
+            worker_id=worker_id,
+            pod_id=pod_id,
+            session_id=session_id,
         )
 
-        # Phase 6: Supervisor evaluates → PASS
-        status_2, gaps_2 = comparator.evaluate(
-            instructions="Generate report with 3 sections",
-            result="PASS",
-        )
+        # Supervisor evaluates → PASS
+        status_2, gaps_2 = comparator.evaluate(instructions=instructions, result="PASS")
 
         assert status_2 == "PASS"
         assert gaps_2 == []
 
-        # Phase 7: Supervisor writes PASS feedback
         feedback_file_2 = feedback_mgr.write_pass(
             result="PASS",
             attempts=2,
             pod_dir=pod_dir,
-            pod_id="pod-feedback-loop",
+            pod_id=pod_id,
         )
 
         # Assert: Complete feedback loop executed
         assert Path(feedback_file_1).exists()
         assert Path(feedback_file_2).exists()
 
-        with open(feedback_file_2, "r") as f:
-            final_feedback = json.load(f)
+        final_feedback = load_json(feedback_file_2)
 
         assert final_feedback["status"] == "PASS"
         assert final_feedback["attempts"] == 2
 
-
-class TestEndToEndPodLifecycleAllComponents:
-    """Test complete pod lifecycle with all 6 components."""
-
-    @patch("src.components.worker_executor.LLMProvider")
     def test_complete_pod_lifecycle_supervisor_creates_worker_executes_supervisor_evaluates(
-        self, mock_llm_provider_class, tmp_path
+        self,
+        pod_with_instructions,
+        result_mgr,
+        comparator,
+        feedback_mgr,
+        monkeypatch,
+        llm_config_path,
+        load_json,
     ):
-        """End-to-end pod lifecycle: Instructions → Execution → Evaluation → Feedback.
-
-        Tests: ALL 6 components working together
-        - InstructionManager: Create instructions
-        - WorkerExecutor: Execute task
-        - LLMProvider: Generate result
-        - ResultManager: Store result
-        - RequirementComparator: Evaluate result
-        - FeedbackManager: Write feedback
-        """
-        # Arrange: Mock LLM
-        mock_llm_instance = Mock()
-        mock_llm_instance.generate.return_value = "PASS"  # Binary evaluator
-        mock_llm_provider_class.return_value = mock_llm_instance
-
-        # Setup pod structure
-        pod_dir = tmp_path / "pod-e2e-test"
-        pod_dir.mkdir()
-        worker_dir = pod_dir / "workers" / "worker-e2e-001"
-        worker_dir.mkdir(parents=True)
-
-        # Initialize all components
-        instruction_mgr = InstructionManager()
-        worker_executor = WorkerExecutor()
-        result_mgr = ResultManager()
-        comparator = RequirementComparator()
-        feedback_mgr = FeedbackManager()
-
-        # === PHASE 1: Supervisor creates instructions ===
-        instructions_file = instruction_mgr.create(
-            instructions="Validate user authentication flow",
-            pod_dir=pod_dir,
-            session_id="session-e2e-001",
+        """WorkerExecutor + LLMProvider produce a result that passes on attempt #1."""
+        # Arrange: Pod with supervisor instructions and a stubbed LLM
+        pod_id = "pod-e2e-test"
+        session_id = "session-e2e-001"
+        worker_id = "worker-e2e-001"
+        instructions = "Validate user authentication flow"
+        pod_dir, worker_dir, instructions_file = pod_with_instructions(
+            pod_id, session_id, worker_id, instructions
         )
+        monkeypatch.setattr("src.components.worker_executor.LLMProvider", _FakeLLMProvider)
 
-        assert Path(instructions_file).exists()
-
-        # Create LLM config file for worker
-        llm_config_file = tmp_path / "llm_config.json"
-        llm_config_file.write_text(json.dumps({"model": "gpt-4", "temperature": 0.7}))
-
-        # === PHASE 2: Worker executes task ===
-        result_file = worker_executor.execute(
+        # Act: Worker executes task
+        result_file = WorkerExecutor().execute(
             instructions_path=instructions_file,
             worker_config={
-                "worker_id": "worker-e2e-001",
+                "worker_id": worker_id,
                 "worker_dir": worker_dir,  # Pass as Path object, not string
-                "pod_id": "pod-e2e-test",
-                "session_id": "session-e2e-001",
-                "llm_config_path": str(llm_config_file),
+                "pod_id": pod_id,
+                "session_id": session_id,
+                "llm_config_path": str(llm_config_path),
             },
         )
 
         assert Path(result_file).exists()
 
-        # === PHASE 3: Supervisor reads result ===
+        # Supervisor reads and evaluates result
         result_data = result_mgr.read(result_file)
         assert "result" in result_data
 
-        # === PHASE 4: Supervisor evaluates result ===
         status, gaps = comparator.evaluate(
-            instructions="Validate user authentication flow",
+            instructions=instructions,
             result=result_data["result"],
         )
 
-        # === PHASE 5: Supervisor writes feedback ===
         if status == "PASS":
             feedback_file = feedback_mgr.write_pass(
                 result=result_data["result"],
                 attempts=1,
                 pod_dir=pod_dir,
-                pod_id="pod-e2e-test",
+                pod_id=pod_id,
             )
         else:
             feedback_file = feedback_mgr.write_fail(
                 gaps=gaps,
                 attempt=1,
                 pod_dir=pod_dir,
-                pod_id="pod-e2e-test",
+                pod_id=pod_id,
             )
 
         # Assert: Complete pod lifecycle executed
         assert Path(feedback_file).exists()
 
-        with open(feedback_file, "r") as f:
-            feedback_data = json.load(f)
+        feedback_data = load_json(feedback_file)
 
         assert feedback_data["status"] == "PASS"
-        assert feedback_data["pod_id"] == "pod-e2e-test"
-
-
-class TestCrossComponentDataConsistency:
-    """Test data consistency across component boundaries."""
-
-    def test_pod_id_and_session_id_propagate_through_all_components(self, tmp_path):
-        """Verify pod_id and session_id flow correctly through all components.
-
-        Tests: Metadata consistency across InstructionManager → ResultManager → FeedbackManager
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-metadata-test"
-        pod_dir.mkdir()
-        worker_dir = pod_dir / "workers" / "worker-meta-001"
-        worker_dir.mkdir(parents=True)
+        assert feedback_data["pod_id"] == pod_id
 
+    def test_pod_id_and_session_id_propagate_through_all_components(
+        self, pod_with_instructions, result_mgr, feedback_mgr, load_json
+    ):
+        """pod_id and session_id flow through Instruction → Result → Feedback managers."""
+        # Arrange: Pod with supervisor instructions
         pod_id = "pod-metadata-test"
         session_id = "session-metadata-001"
-
-        instruction_mgr = InstructionManager()
-        result_mgr = ResultManager()
-        feedback_mgr = FeedbackManager()
-
-        # Act: Flow metadata through all components
-        # 1. Instructions
-        instructions_file = instruction_mgr.create(
-            instructions="Test task",
-            pod_dir=pod_dir,
-            session_id=session_id,
+        worker_id = "worker-meta-001"
+        pod_dir, worker_dir, instructions_file = pod_with_instructions(
+            pod_id, session_id, worker_id, "Test task"
         )
 
-        with open(instructions_file, "r") as f:
-            inst_data = json.load(f)
-
-        # 2. Result
+        # Act: Write result and feedback
         result_file = result_mgr.write(
             result="Task complete",
             worker_dir=worker_dir,
-            worker_id="worker-meta-001",
+            worker_id=worker_id,
             pod_id=pod_id,
             session_id=session_id,
         )
 
-        with open(result_file, "r") as f:
-            result_data = json.load(f)
-
-        # 3. Feedback
         feedback_file = feedback_mgr.write_pass(
             result="PASS",
             attempts=1,
@@ -457,8 +391,9 @@ class TestCrossComponentDataConsistency:
             pod_id=pod_id,
         )
 
-        with open(feedback_file, "r") as f:
-            feedback_data = json.load(f)
+        inst_data = load_json(instructions_file)
+        result_data = load_json(result_file)
+        feedback_data = load_json(feedback_file)
 
         # Assert: Metadata consistent
         assert inst_data["pod_id"] == pod_id
@@ -473,17 +408,15 @@ class TestCrossComponentDataConsistency:
 class TestComponentErrorPropagation:
     """Test error handling across component boundaries."""
 
-    def test_invalid_instructions_rejected_before_reaching_worker(self, tmp_path):
+    def test_invalid_instructions_rejected_before_reaching_worker(self, pod_root, instruction_mgr):
         """InstructionManager validation prevents invalid data from reaching WorkerExecutor.
 
         Tests: Error handling at component boundary
         """
         # Arrange
-        pod_dir = tmp_path / "pod-invalid-inst"
+        pod_dir = pod_root / "pod-invalid-inst"
         pod_dir.mkdir()
 
-        instruction_mgr = InstructionManager()
-
         # Act & Assert: Empty instructions raise ValueError
         with pytest.raises(ValueError, match="Instruction validation failed"):
             instruction_mgr.create(
@@ -492,23 +425,20 @@ class TestComponentErrorPropagation:
                 session_id="session-invalid-001",
             )
 
-    def test_result_validation_failure_captured_in_feedback(self, tmp_path):
+    def test_result_validation_failure_captured_in_feedback(
+        self, make_pod, result_mgr, feedback_mgr, load_json
+    ):
         """Invalid result triggers feedback loop with validation errors.
 
         Tests: ResultManager validation → FeedbackManager captures errors
         """
         # Arrange
-        pod_dir = tmp_path / "pod-invalid-result"
-        pod_dir.mkdir()
+        pod_dir = make_pod("pod-invalid-result", ["worker-001"])
         worker_dir = pod_dir / "workers" / "worker-001"
-        worker_dir.mkdir(parents=True)
 
         result_file = worker_dir / "result.json"
         # Invalid: missing required fields
-        result_file.write_text(json.dumps({"result": "done"}))
-
-        result_mgr = ResultManager()
-        feedback_mgr = FeedbackManager()
+        result_file.write_bytes(orjson.dumps({"result": "done"}))
 
         # Act: Validate result
         is_valid, errors = result_mgr.validate_file(str(result_file))
@@ -525,8 +455,7 @@ class TestComponentErrorPropagation:
         )
 
         # Assert: Feedback captures validation errors
-        with open(feedback_file, "r") as f:
-            feedback_data = json.load(f)
+        feedback_data = load_json(feedback_file)
 
         assert feedback_data["status"] == "FAIL"
         assert len(feedback_data["gaps"]) > 0
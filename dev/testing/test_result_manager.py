@@ -11,20 +11,22 @@ Test Coverage:
 Requirements tested: Issue #13 - ResultManager component
 """
 
-import json
+import orjson
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import patch
+
 from src.components.result_manager import ResultManager
 
 
 class TestResultManagerRead:
     """Test reading result.json files from worker directories."""
 
-    def test_read_valid_result_file_returns_dict(self, tmp_path):
+    def test_read_valid_result_file_returns_dict(self, pod_root, result_mgr):
         """Read a valid result.json and return its contents as dict."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         worker_dir.mkdir(parents=True)
         result_file = worker_dir / "result.json"
         expected_data = {
@@ -32,54 +34,50 @@ class TestResultManagerRead:
             "worker_id": "worker-001",
             "metadata": {"timestamp": "2025-12-24T00:00:00Z"},
         }
-        result_file.write_text(json.dumps(expected_data))
-        manager = ResultManager()
+        result_file.write_bytes(orjson.dumps(expected_data))
 
         # Act
-        result = manager.read(str(result_file))
+        result = result_mgr.read(str(result_file))
 
         # Assert
         assert result == expected_data
         assert result["result"] == "task completed"
 
-    def test_read_validates_file_structure_before_returning(self, tmp_path):
+    def test_read_validates_file_structure_before_returning(self, pod_root, result_mgr):
         """Read operation validates JSON structure before returning data."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         worker_dir.mkdir(parents=True)
         result_file = worker_dir / "result.json"
         # Invalid structure - missing required 'result' field
         invalid_data = {"worker_id": "worker-001"}
-        result_file.write_text(json.dumps(invalid_data))
-        manager = ResultManager()
+        result_file.write_bytes(orjson.dumps(invalid_data))
 
         # Act & Assert
         with pytest.raises(ValueError, match="Invalid result structure"):
-            manager.read(str(result_file))
+            result_mgr.read(str(result_file))
 
-    def test_read_nonexistent_file_raises_file_not_found(self, tmp_path):
+    def test_read_nonexistent_file_raises_file_not_found(self, path_only_root, result_mgr):
         """Reading non-existent result.json raises FileNotFoundError."""
         # Arrange
-        nonexistent_file = tmp_path / "workers" / "worker-999" / "result.json"
-        manager = ResultManager()
+        nonexistent_file = path_only_root / "workers" / "worker-999" / "result.json"
 
         # Act & Assert
         with pytest.raises(FileNotFoundError):
-            manager.read(str(nonexistent_file))
+            result_mgr.read(str(nonexistent_file))
 
 
 class TestResultManagerWrite:
     """Test writing result.json files to worker directories."""
 
-    def test_write_creates_result_file_in_worker_directory(self, tmp_path):
+    def test_write_creates_result_file_in_worker_directory(self, pod_root, result_mgr):
         """Write creates result.json in correct worker-specific directory."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         result_content = "analysis complete"
-        manager = ResultManager()
 
         # Act
-        file_path = manager.write(
+        file_path = result_mgr.write(
             result=result_content,
             worker_dir=worker_dir,
             worker_id="worker-001",
@@ -92,15 +90,14 @@ class TestResultManagerWrite:
         assert Path(file_path).name == "result.json"
         assert Path(file_path).parent == worker_dir
 
-    def test_write_includes_all_required_metadata(self, tmp_path):
+    def test_write_includes_all_required_metadata(self, pod_root, result_mgr, load_json):
         """Write includes worker_id, pod_id, session_id, and timestamp."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         result_content = "task done"
-        manager = ResultManager()
 
         # Act
-        file_path = manager.write(
+        file_path = result_mgr.write(
             result=result_content,
             worker_dir=worker_dir,
             worker_id="worker-001",
@@ -109,18 +106,17 @@ class TestResultManagerWrite:
         )
 
         # Assert
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = load_json(file_path)
         assert data["worker_id"] == "worker-001"
         assert data["pod_id"] == "pod-123"
         assert data["session_id"] == "session-456"
         assert "timestamp" in data
         assert data["result"] == result_content
 
-    def test_write_performs_atomic_write_operation(self, tmp_path):
+    def test_write_performs_atomic_write_operation(self, pod_root):
         """Write uses atomic write (temp file + rename) to prevent partial files."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         result_content = "atomic test"
         manager = ResultManager()
 
@@ -138,17 +134,16 @@ class TestResultManagerWrite:
             # Assert
             mock_writer.return_value.write.assert_called_once()
 
-    def test_write_validates_before_writing(self, tmp_path):
+    def test_write_validates_before_writing(self, path_only_root, result_mgr):
         """Write validates result structure before writing to disk."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = path_only_root / "workers" / "worker-001"
         # Empty result should fail validation
         invalid_result = ""
-        manager = ResultManager()
 
         # Act & Assert
         with pytest.raises(ValueError, match="Invalid result"):
-            manager.write(
+            result_mgr.write(
                 result=invalid_result,
                 worker_dir=worker_dir,
                 worker_id="worker-001",
@@ -160,10 +155,10 @@ class TestResultManagerWrite:
 class TestResultManagerValidation:
     """Test validation of result.json file structure."""
 
-    def test_validate_file_returns_true_for_valid_structure(self, tmp_path):
+    def test_validate_file_returns_true_for_valid_structure(self, pod_root, result_mgr):
         """Validate returns (True, []) for correctly structured result.json."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         worker_dir.mkdir(parents=True)
         result_file = worker_dir / "result.json"
         valid_data = {
@@ -173,67 +168,65 @@ class TestResultManagerValidation:
             "session_id": "session-456",
             "timestamp": "2025-12-24T00:00:00Z",
         }
-        result_file.write_text(json.dumps(valid_data))
-        manager = ResultManager()
+        result_file.write_bytes(orjson.dumps(valid_data))
 
         # Act
-        is_valid, errors = manager.validate_file(str(result_file))
+        is_valid, errors = result_mgr.validate_file(str(result_file))
 
         # Assert
         assert is_valid is True
         assert errors == []
 
-    def test_validate_file_returns_false_with_errors_for_invalid_structure(self, tmp_path):
+    def test_validate_file_returns_false_with_errors_for_invalid_structure(
+        self, pod_root, result_mgr
+    ):
         """Validate returns (False, [errors]) for missing required fields."""
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         worker_dir.mkdir(parents=True)
         result_file = worker_dir / "result.json"
         # Missing required fields
         invalid_data = {"result": "incomplete"}
-        result_file.write_text(json.dumps(invalid_data))
-        manager = ResultManager()
+        result_file.write_bytes(orjson.dumps(invalid_data))
 
         # Act
-        is_valid, errors = manager.validate_file(str(result_file))
+        is_valid, errors = result_mgr.validate_file(str(result_file))
 
         # Assert
         assert is_valid is False
         assert len(errors) > 0
         assert any("worker_id" in err for err in errors)
 
-    def test_validate_file_handles_file_not_found_error(self, tmp_path):
+    def test_validate_file_handles_file_not_found_error(self, path_only_root, result_mgr):
         """Validate returns (False, error) for non-existent file.
 
         Covers lines 124-125: FileNotFoundError exception handling
         """
         # Arrange
-        nonexistent_file = tmp_path / "workers" / "worker-999" / "result.json"
-        manager = ResultManager()
+        nonexistent_file = path_only_root / "workers" / "worker-999" / "result.json"
 
         # Act
-        is_valid, errors = manager.validate_file(str(nonexistent_file))
+        is_valid, errors = result_mgr.validate_file(str(nonexistent_file))
 
         # Assert
         assert is_valid is False
         assert len(errors) == 1
         assert "File not found or invalid JSON" in errors[0]
 
-    def test_validate_file_handles_json_decode_error(self, tmp_path):
+    def test_validate_file_handles_json_decode_error(self, pod_root, result_mgr):
         """Validate returns (False, error) for malformed JSON.
 
         Covers lines 124-125: json.JSONDecodeError exception handling
         """
         # Arrange
-        worker_dir = tmp_path / "workers" / "worker-001"
+        worker_dir = pod_root / "workers" / "worker-001"
         worker_dir.mkdir(parents=True)
         result_file = worker_dir / "result.json"
         # Write invalid JSON
         result_file.write_text("{invalid json content}")
-        manager = ResultManager()
 
         # Act
-        is_valid, errors = manager.validate_file(str(result_file))
+        is_valid, errors = result_mgr.validate_file(str(result_file))
 
         # Assert
         assert is_valid is False
@@ -244,131 +237,125 @@ class TestResultManagerValidation:
 class TestResultManagerAggregation:
     """Test aggregating results from multiple workers in a pod."""
 
-    def test_aggregate_worker_results_returns_all_worker_results(self, tmp_path):
+    def test_aggregate_worker_results_returns_all_worker_results(self, make_pod, result_mgr):
         """Aggregate reads result.json from all workers in pod directory."""
         # Arrange
-        pod_dir = tmp_path / "pod-123"
         workers = ["worker-001", "worker-002", "worker-003"]
+        pod_dir = make_pod("pod-123", workers)
 
         for worker_id in workers:
-            worker_dir = pod_dir / "workers" / worker_id
-            worker_dir.mkdir(parents=True)
-            result_file = worker_dir / "result.json"
-            result_data = {
+            result = {
                 "result": f"{worker_id} completed",
                 "worker_id": worker_id,
                 "pod_id": "pod-123",
             }
-            result_file.write_text(json.dumps(result_data))
-
-        manager = ResultManager()
+            (pod_dir / "workers" / worker_id / "result.json").write_bytes(orjson.dumps(result))
 
         # Act
-        aggregated = manager.aggregate_worker_results(pod_dir)
+        aggregated = result_mgr.aggregate_worker_results(pod_dir)
 
         # Assert
         assert len(aggregated) == 3
         worker_ids = [r["worker_id"] for r in aggregated]
         assert set(worker_ids) == set(workers)
 
-    def test_aggregate_handles_missing_worker_results_gracefully(self, tmp_path):
+    def test_aggregate_handles_missing_worker_results_gracefully(self, make_pod, result_mgr):
         """Aggregate skips workers with missing result.json files."""
         # Arrange
-        pod_dir = tmp_path / "pod-123"
+        # Worker 2 directory exists but no result.json
+        pod_dir = make_pod("pod-123", ["worker-001", "worker-002"])
         # Worker 1 has result
         worker1_dir = pod_dir / "workers" / "worker-001"
-        worker1_dir.mkdir(parents=True)
         result1_file = worker1_dir / "result.json"
-        result1_file.write_text(json.dumps({"result": "done", "worker_id": "worker-001"}))
-
-        # Worker 2 directory exists but no result.json
-        worker2_dir = pod_dir / "workers" / "worker-002"
-        worker2_dir.mkdir(parents=True)
-
-        manager = ResultManager()
+        result1_file.write_bytes(orjson.dumps({"result": "done", "worker_id": "worker-001"}))
 
         # Act
-        aggregated = manager.aggregate_worker_results(pod_dir)
+        aggregated = result_mgr.aggregate_worker_results(pod_dir)
 
         # Assert
         # Should return only worker-001's result, skip worker-002
         assert len(aggregated) == 1
         assert aggregated[0]["worker_id"] == "worker-001"
 
-    def test_aggregate_returns_empty_list_when_no_workers_exist(self, tmp_path):
+    def test_aggregate_returns_empty_list_when_no_workers_exist(self, path_only_root, result_mgr):
         """Aggregate returns [] when pod has no workers directory."""
         # Arrange
-        pod_dir = tmp_path / "pod-empty"
-        pod_dir.mkdir()
-        manager = ResultManager()
+        pod_dir = path_only_root / "pod-empty"
 
         # Act
-        aggregated = manager.aggregate_worker_results(pod_dir)
+        aggregated = result_mgr.aggregate_worker_results(pod_dir)
 
         # Assert
         assert aggregated == []
 
-    def test_aggregate_skips_non_directory_items_in_workers_folder(self, tmp_path):
+    def test_aggregate_skips_non_directory_items_in_workers_folder(self, make_pod, result_mgr):
         """Aggregate skips files in workers directory, only processes directories.
 
         Covers line 160: continue when worker_dir.is_dir() is False
         """
         # Arrange
-        pod_dir = tmp_path / "pod-123"
-        workers_dir = pod_dir / "workers"
-        workers_dir.mkdir(parents=True)
-
         # Create a valid worker directory with result
+        pod_dir = make_pod("pod-123", ["worker-001"])
+        workers_dir = pod_dir / "workers"
         worker1_dir = workers_dir / "worker-001"
-        worker1_dir.mkdir()
         result1_file = worker1_dir / "result.json"
-        result1_file.write_text(json.dumps({"result": "done", "worker_id": "worker-001"}))
+        result1_file.write_bytes(orjson.dumps({"result": "done", "worker_id": "worker-001"}))
 
         # Create files (not directories) in workers directory - should be skipped
         (workers_dir / "README.txt").write_text("This is a file, not a directory")
         (workers_dir / "config.json").write_text("{}")
 
-        manager = ResultManager()
-
         # Act
-        aggregated = manager.aggregate_worker_results(pod_dir)
+        aggregated = result_mgr.aggregate_worker_results(pod_dir)
 
         # Assert - Should only return worker-001, skipping files
         assert len(aggregated) == 1
         assert aggregated[0]["worker_id"] == "worker-001"
 
-    def test_aggregate_skips_workers_with_malformed_json(self, tmp_path):
+    def test_aggregate_keeps_results_stdlib_json_accepts(self, make_pod, result_mgr):
+        """Results with NaN or integers wider than 64 bits are aggregated, not skipped."""
+        # Arrange
+        pod_dir = make_pod("pod-123", ["worker-001"])
+        (pod_dir / "workers" / "worker-001" / "result.json").write_text(
+            '{"result": "done", "worker_id": "worker-001", "score": NaN,'
+            ' "id": 123456789012345678901234567890}'
+        )
+
+        # Act
+        aggregated = result_mgr.aggregate_worker_results(pod_dir)
+
+        # Assert
+        assert len(aggregated) == 1
+        assert aggregated[0]["score"] != aggregated[0]["score"]  # NaN
+        assert aggregated[0]["id"] == 123456789012345678901234567890
+
+    def test_aggregate_skips_workers_with_malformed_json(self, make_pod, result_mgr):
         """Aggregate gracefully skips workers with invalid JSON in result files.
 
         Covers lines 172, 174: except clause for json.JSONDecodeError and continue
         """
         # Arrange
-        pod_dir = tmp_path / "pod-123"
+        pod_dir = make_pod("pod-123", ["worker-001", "worker-002", "worker-003"])
         workers_dir = pod_dir / "workers"
 
         # Worker 1 - valid result
         worker1_dir = workers_dir / "worker-001"
-        worker1_dir.mkdir(parents=True)
-        (worker1_dir / "result.json").write_text(
-            json.dumps({"result": "success", "worker_id": "worker-001"})
+        (worker1_dir / "result.json").write_bytes(
+            orjson.dumps({"result": "success", "worker_id": "worker-001"})
         )
 
         # Worker 2 - malformed JSON (should be skipped)
         worker2_dir = workers_dir / "worker-002"
-        worker2_dir.mkdir(parents=True)
         (worker2_dir / "result.json").write_text("{invalid json")
 
         # Worker 3 - valid result
         worker3_dir = workers_dir / "worker-003"
-        worker3_dir.mkdir(parents=True)
-        (worker3_dir / "result.json").write_text(
-            json.dumps({"result": "done", "worker_id": "worker-003"})
+        (worker3_dir / "result.json").write_bytes(
+            orjson.dumps({"result": "done", "worker_id": "worker-003"})
         )
 
-        manager = ResultManager()
-
         # Act
-        aggregated = manager.aggregate_worker_results(pod_dir)
+        aggregated = result_mgr.aggregate_worker_results(pod_dir)
 
         # Assert - Should return 2 results, skipping worker-002 with malformed JSON
         assert len(aggregated) == 2
@@ -381,25 +368,28 @@ class TestResultManagerAggregation:
 class TestResultManagerConcurrency:
     """Test concurrent worker isolation and collision prevention."""
 
-    def test_concurrent_workers_write_to_isolated_directories(self, tmp_path):
+    def test_concurrent_workers_write_to_isolated_directories(
+        self, pod_root, result_mgr, load_json
+    ):
         """Multiple workers writing simultaneously don't collide (isolated dirs)."""
         # Arrange
-        pod_dir = tmp_path / "pod-123"
+        pod_dir = pod_root / "pod-123"
         worker_ids = ["worker-001", "worker-002", "worker-003"]
-        manager = ResultManager()
 
-        # Act - Simulate concurrent writes
-        file_paths = []
-        for worker_id in worker_ids:
-            worker_dir = pod_dir / "workers" / worker_id
-            file_path = manager.write(
-                result=f"{worker_id} result",
-                worker_dir=worker_dir,
-                worker_id=worker_id,
-                pod_id="pod-123",
-                session_id="session-456",
-            )
-            file_paths.append(Path(file_path))
+        # Act - Concurrent writes from one thread per worker
+        with ThreadPoolExecutor(max_workers=len(worker_ids)) as executor:
+            futures = [
+                executor.submit(
+                    result_mgr.write,
+                    result=f"{worker_id} result",
+                    worker_dir=pod_dir / "workers" / worker_id,
+                    worker_id=worker_id,
+                    pod_id="pod-123",
+                    session_id="session-456",
+                )
+                for worker_id in worker_ids
+            ]
+            file_paths = [Path(future.result()) for future in futures]
 
         # Assert - All files exist in separate directories
         assert len(file_paths) == 3
@@ -408,6 +398,5 @@ class TestResultManagerConcurrency:
 
         # Verify each file contains correct worker_id
         for worker_id, file_path in zip(worker_ids, file_paths):
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = load_json(file_path)
             assert data["worker_id"] == worker_id
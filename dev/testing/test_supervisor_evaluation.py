@@ -14,222 +14,167 @@ Requirements tested: Issue #19 - Feature: SupervisorEvaluation
 Composition: RequirementComparator (#16), FeedbackManager (#14)
 """
 
-import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import orjson
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch
+from _sup_eval_fixtures import (
+    INSTR_FIELDS,
+    INSTR_PASS,
+    INSTR_TASK,
+    RESULT_EMPTY,
+    RESULT_FAIL,
+    RESULT_PARTIAL,
+    RESULT_PASS,
+)
+
+from src.components.feedback_manager import FeedbackManager
+from src.components.requirement_comparator import RequirementComparator
 from src.features.supervisor_evaluation import SupervisorEvaluation
 
+# Expected feedback.json subsets (timestamp is checked separately)
+EXPECTED_PASS_FIRST = {"status": "PASS", "result": "PASS", "attempts": 1, "pod_id": "pod-001"}
+EXPECTED_FAIL_FIRST = {"status": "FAIL", "attempt": 1, "pod_id": "pod-001"}
 
-class TestSupervisorEvaluationPassCase:
-    """Test successful evaluation (PASS) scenarios."""
 
-    def test_evaluate_pass_writes_pass_feedback(self, tmp_path):
-        """
-        When result meets requirements exactly, write PASS feedback.
+def _read_feedback(pod_dir):
+    """Parse pod_dir/feedback.json with a single bytes read."""
+    return orjson.loads((pod_dir / "feedback.json").read_bytes())
 
-        Acceptance: Evaluates correctly (PASS when requirements met)
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        # Create instructions.json
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {
-            "instructions": "Calculate 2+2 and return PASS if correct",
-            "output_path": "result.json",
-        }
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        # Create result.json with PASS
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "PASS"}
-        result_file.write_text(json.dumps(result_data))
 
-        supervisor = SupervisorEvaluation()
+class _NullLogger:
+    """Logger stand-in that drops every record and reports every level disabled."""
 
-        # Act
-        status = supervisor.evaluate(pod_dir, pod_id="pod-001")
+    def is_enabled_for(self, level):
+        return False
 
-        # Assert
-        assert status == "PASS"
+    def debug(self, message, context=None):
+        pass
 
-        # Verify feedback.json was written with PASS
-        feedback_file = pod_dir / "feedback.json"
-        assert feedback_file.exists()
+    info = warning = error = debug
 
-        feedback_data = json.loads(feedback_file.read_text())
-        assert feedback_data["status"] == "PASS"
-        assert feedback_data["result"] == "PASS"
-        assert feedback_data["attempts"] == 1
-        assert feedback_data["pod_id"] == "pod-001"
-        assert "timestamp" in feedback_data
 
-    def test_evaluate_pass_increments_attempt_count_after_retries(self, tmp_path):
-        """
-        When evaluation passes after multiple attempts, attempt count reflects total tries.
+class _RecordingLogger(_NullLogger):
+    """Logger stand-in that keeps (message, context) pairs from info()."""
 
-        Acceptance: Tracks attempt count correctly
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
+    def __init__(self):
+        self.records = []
 
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Do something", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
+    def is_enabled_for(self, level):
+        return True
 
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "PASS"}
-        result_file.write_text(json.dumps(result_data))
+    def info(self, message, context=None):
+        self.records.append((message, context))
 
-        # Simulate previous failed attempt by setting current_attempt=2
-        supervisor = SupervisorEvaluation(current_attempt=2)
 
-        # Act
-        status = supervisor.evaluate(pod_dir, pod_id="pod-001")
+@pytest.fixture(scope="module")
+def _module_supervisor():
+    """One SupervisorEvaluation (and its comparator/feedback manager) per module.
 
-        # Assert
-        assert status == "PASS"
-
-        feedback_file = pod_dir / "feedback.json"
-        feedback_data = json.loads(feedback_file.read_text())
-        assert feedback_data["attempts"] == 2  # Reflects all attempts
-
-    def test_evaluate_pass_logs_evaluation_details(self, tmp_path):
-        """
-        When evaluation passes, log evaluation details for debugging.
-
-        Acceptance: Logs evaluation details
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
+    Its loggers are silenced; tests asserting on log output swap in a
+    _RecordingLogger themselves.
+    """
+    supervisor = SupervisorEvaluation()
+    supervisor.logger = _NullLogger()
+    supervisor.comparator.logger = _NullLogger()
+    return supervisor
 
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Test task", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
 
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "PASS"}
-        result_file.write_text(json.dumps(result_data))
+@pytest.fixture
+def fresh_supervisor(_module_supervisor):
+    """Module-shared supervisor with per-test state (attempts, history) reset."""
+    _module_supervisor.reset()
+    return _module_supervisor
 
-        supervisor = SupervisorEvaluation()
-
-        # Act & Assert - verify logging happens
-        with patch("src.features.supervisor_evaluation.Logger") as mock_logger_class:
-            mock_logger = Mock()
-            mock_logger_class.return_value = mock_logger
 
-            supervisor_with_mock = SupervisorEvaluation()
-            supervisor_with_mock.logger = mock_logger
+@pytest.fixture
+def supervisor_factory(fresh_supervisor):
+    """Return the module-shared supervisor primed with a given attempt count."""
 
-            status = supervisor_with_mock.evaluate(pod_dir, pod_id="pod-001")
+    def _make(current_attempt=0):
+        fresh_supervisor.reset(current_attempt=current_attempt)
+        return fresh_supervisor
 
-            # Verify logger.info was called with evaluation details
-            mock_logger.info.assert_called()
-            call_args = mock_logger.info.call_args
-            assert "PASS" in str(call_args)
+    return _make
 
 
-class TestSupervisorEvaluationFailCase:
-    """Test failed evaluation (FAIL) scenarios."""
+class TestSupervisorEvaluationPassFail:
+    """Test PASS/FAIL outcomes: feedback written, attempt counting and logging."""
 
-    def test_evaluate_fail_writes_fail_feedback_with_gaps(self, tmp_path):
+    @pytest.mark.parametrize(
+        "current_attempt,result_bytes,expected_feedback",
+        [
+            # PASS with default current_attempt=0 counts as attempt 1
+            pytest.param(0, RESULT_PASS, EXPECTED_PASS_FIRST, id="pass-first-try"),
+            # PASS after previous failures reflects all attempts
+            pytest.param(
+                2, RESULT_PASS, {**EXPECTED_PASS_FIRST, "attempts": 2}, id="pass-after-retries"
+            ),
+            # FAIL writes the next attempt number for retry
+            pytest.param(0, RESULT_FAIL, EXPECTED_FAIL_FIRST, id="fail-first-try"),
+            pytest.param(
+                1, RESULT_FAIL, {**EXPECTED_FAIL_FIRST, "attempt": 2}, id="fail-after-retry"
+            ),
+        ],
+    )
+    def test_evaluate(
+        self,
+        pod_factory,
+        supervisor_factory,
+        monkeypatch,
+        current_attempt,
+        result_bytes,
+        expected_feedback,
+    ):
         """
-        When result doesn't meet requirements, write FAIL feedback with specific gaps.
+        Binary evaluation writes PASS/FAIL feedback, tracks attempts and logs details.
 
-        Acceptance: Evaluates correctly (FAIL when requirements missing)
+        Acceptance: Evaluates correctly (PASS when requirements met, FAIL when missing)
+        Acceptance: Tracks attempt count correctly
+        Acceptance: Writes correct feedback files
+        Acceptance: Logs evaluation details
         """
         # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {
-            "instructions": "Calculate 2+2 and return PASS if correct",
-            "output_path": "result.json",
-        }
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        # Result is wrong (not PASS)
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "5"}
-        result_file.write_text(json.dumps(result_data))
-
-        supervisor = SupervisorEvaluation()
+        pod_dir = pod_factory("pod-001", INSTR_PASS, result_bytes)
+        supervisor = supervisor_factory(current_attempt=current_attempt)
+        logger = _RecordingLogger()
+        monkeypatch.setattr(supervisor, "logger", logger)
 
         # Act
         status = supervisor.evaluate(pod_dir, pod_id="pod-001")
 
         # Assert
-        assert status == "FAIL"
+        expected_status = expected_feedback["status"]
+        assert status == expected_status
 
-        # Verify feedback.json was written with FAIL and gaps
-        feedback_file = pod_dir / "feedback.json"
-        assert feedback_file.exists()
-
-        feedback_data = json.loads(feedback_file.read_text())
-        assert feedback_data["status"] == "FAIL"
-        assert "gaps" in feedback_data
-        assert len(feedback_data["gaps"]) > 0
-        assert feedback_data["attempt"] == 1
-        assert feedback_data["pod_id"] == "pod-001"
-
-    def test_evaluate_fail_increments_attempt_count(self, tmp_path):
-        """
-        When evaluation fails, increment attempt count for retry.
-
-        Acceptance: Tracks attempt count correctly
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Do task", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "wrong"}
-        result_file.write_text(json.dumps(result_data))
+        # Raises FileNotFoundError if no feedback was written
+        feedback_data = _read_feedback(pod_dir)
+        assert expected_feedback.items() <= feedback_data.items()
+        assert "timestamp" in feedback_data
+        if expected_status == "FAIL":
+            assert len(feedback_data["gaps"]) > 0
 
-        supervisor = SupervisorEvaluation(current_attempt=1)
+        # Verify logger.info recorded the evaluation details
+        message, context = logger.records[-1]
+        assert expected_status in message
+        assert context["status"] == expected_status
 
-        # Act
-        status = supervisor.evaluate(pod_dir, pod_id="pod-001")
 
-        # Assert
-        assert status == "FAIL"
-
-        feedback_file = pod_dir / "feedback.json"
-        feedback_data = json.loads(feedback_file.read_text())
-        assert feedback_data["attempt"] == 2  # Incremented from 1 to 2
+class TestSupervisorEvaluationFailCase:
+    """Test failed evaluation (FAIL) scenarios."""
 
-    def test_evaluate_fail_includes_specific_gaps(self, tmp_path):
+    def test_evaluate_fail_includes_specific_gaps(self, pod_factory, fresh_supervisor):
         """
         FAIL feedback must include specific, actionable gap descriptions.
 
         Acceptance: Writes correct feedback files with specific gaps
         """
         # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {
-            "instructions": "Return JSON with fields: name, age, email",
-            "output_path": "result.json",
-        }
-        instructions_file.write_text(json.dumps(instructions_data))
-
         # Result missing required fields
-        result_file = pod_dir / "result.json"
-        result_data = {"result": '{"name": "Alice"}'}
-        result_file.write_text(json.dumps(result_data))
+        pod_dir = pod_factory("pod-001", INSTR_FIELDS, RESULT_PARTIAL)
 
-        supervisor = SupervisorEvaluation()
+        supervisor = fresh_supervisor
 
         # Act
         status = supervisor.evaluate(pod_dir, pod_id="pod-001")
@@ -237,8 +182,7 @@ class TestSupervisorEvaluationFailCase:
         # Assert
         assert status == "FAIL"
 
-        feedback_file = pod_dir / "feedback.json"
-        feedback_data = json.loads(feedback_file.read_text())
+        feedback_data = _read_feedback(pod_dir)
         assert "gaps" in feedback_data
         # Gaps should mention missing fields
         gaps_str = " ".join(feedback_data["gaps"])
@@ -250,257 +194,164 @@ class TestSupervisorEvaluationFailCase:
 class TestSupervisorEvaluationEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_evaluate_empty_result_returns_fail(self, tmp_path):
-        """
-        When result is empty string, evaluation fails with appropriate gap.
-
-        Acceptance: Handles edge cases (empty result)
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Complete task", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        result_file = pod_dir / "result.json"
-        result_data = {"result": ""}
-        result_file.write_text(json.dumps(result_data))
-
-        supervisor = SupervisorEvaluation()
-
-        # Act
-        status = supervisor.evaluate(pod_dir, pod_id="pod-001")
-
-        # Assert
-        assert status == "FAIL"
-
-        feedback_file = pod_dir / "feedback.json"
-        feedback_data = json.loads(feedback_file.read_text())
-        assert "No result provided" in str(feedback_data["gaps"])
-
-    def test_evaluate_malformed_instructions_raises_error(self, tmp_path):
+    @pytest.mark.parametrize(
+        "instructions_bytes,result_bytes,expected",
+        [
+            # Empty result string fails with a "No result provided" gap
+            pytest.param(INSTR_TASK, RESULT_EMPTY, "FAIL", id="empty-result"),
+            # Missing result.json fails gracefully with the same gap
+            pytest.param(INSTR_TASK, None, "FAIL", id="missing-result"),
+            # Missing instructions.json raises a clear error
+            pytest.param(None, None, FileNotFoundError, id="missing-instructions"),
+            # Malformed instructions.json raises ValueError (JSONDecodeError is a subclass)
+            pytest.param(b"{invalid json", None, ValueError, id="malformed-instructions"),
+        ],
+    )
+    def test_evaluate_edge_case(
+        self, pod_factory, fresh_supervisor, instructions_bytes, result_bytes, expected
+    ):
         """
-        When instructions.json is malformed, raise clear error.
+        Empty/missing results fail with a gap; missing/malformed instructions raise.
 
-        Acceptance: Handles edge cases (malformed instructions)
+        Acceptance: Handles edge cases (empty result, malformed instructions, missing files)
         """
         # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
+        pod_dir = pod_factory("pod-001", instructions_bytes, result_bytes)
 
-        # Write invalid JSON
-        instructions_file = pod_dir / "instructions.json"
-        instructions_file.write_text("{invalid json")
-
-        supervisor = SupervisorEvaluation()
+        supervisor = fresh_supervisor
 
         # Act & Assert
-        with pytest.raises((ValueError, json.JSONDecodeError)):
-            supervisor.evaluate(pod_dir, pod_id="pod-001")
-
-    def test_evaluate_missing_result_file_returns_fail(self, tmp_path):
-        """
-        When result.json doesn't exist, evaluation fails gracefully.
-
-        Acceptance: Handles edge cases (missing files)
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Do task", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        # No result.json file created
+        if isinstance(expected, type):
+            with pytest.raises(expected):
+                supervisor.evaluate(pod_dir, pod_id="pod-001")
+            return
 
-        supervisor = SupervisorEvaluation()
-
-        # Act
         status = supervisor.evaluate(pod_dir, pod_id="pod-001")
+        assert status == expected
 
-        # Assert
-        assert status == "FAIL"
-
-        feedback_file = pod_dir / "feedback.json"
-        feedback_data = json.loads(feedback_file.read_text())
+        feedback_data = _read_feedback(pod_dir)
         assert "No result provided" in str(feedback_data["gaps"])
 
-    def test_evaluate_missing_instructions_file_raises_error(self, tmp_path):
-        """
-        When instructions.json doesn't exist, raise clear error.
-
-        Acceptance: Handles edge cases (missing files)
-        """
-        # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        # No instructions.json file
-
-        supervisor = SupervisorEvaluation()
-
-        # Act & Assert
-        with pytest.raises(FileNotFoundError):
-            supervisor.evaluate(pod_dir, pod_id="pod-001")
-
 
 class TestSupervisorEvaluationStateTracking:
     """Test evaluation state and history tracking."""
 
-    def test_evaluation_history_tracks_all_evaluations(self, tmp_path):
+    @pytest.mark.parametrize("n", [1, 2, 5])
+    def test_evaluation_history_tracks_all_evaluations(self, pod_factory, fresh_supervisor, n):
         """
-        Supervisor maintains history of all evaluations for debugging.
+        Every evaluation is appended to history, in order, for debugging and audit.
 
         Acceptance: Maintains evaluation history (for debugging)
         """
         # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
+        # All pods fail except the last one, so n=1 is a lone PASS
+        expected_statuses = ["FAIL"] * (n - 1) + ["PASS"]
+        pods = [
+            pod_factory(f"pod-{i:03}", INSTR_TASK, RESULT_PASS if status == "PASS" else RESULT_FAIL)
+            for i, status in enumerate(expected_statuses, start=1)
+        ]
 
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Task", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "PASS"}
-        result_file.write_text(json.dumps(result_data))
-
-        supervisor = SupervisorEvaluation()
+        supervisor = fresh_supervisor
 
         # Act
-        supervisor.evaluate(pod_dir, pod_id="pod-001")
-
-        # Assert - supervisor should maintain history
-        assert hasattr(supervisor, "evaluation_history")
-        assert len(supervisor.evaluation_history) == 1
+        for i, pod_dir in enumerate(pods, start=1):
+            supervisor.evaluate(pod_dir, pod_id=f"pod-{i:03}")
 
-        history_entry = supervisor.evaluation_history[0]
-        assert history_entry["status"] == "PASS"
-        assert history_entry["pod_id"] == "pod-001"
-        assert "timestamp" in history_entry
+        # Assert
+        history = supervisor.evaluation_history
+        assert len(history) == n
+        assert [entry["status"] for entry in history] == expected_statuses
+        assert [entry["pod_id"] for entry in history] == [f"pod-{i:03}" for i in range(1, n + 1)]
+        assert all("timestamp" in entry for entry in history)
 
-    def test_multiple_evaluations_append_to_history(self, tmp_path):
+    def test_get_current_attempt_returns_correct_count(self, supervisor_factory):
         """
-        Multiple evaluations accumulate in history for audit trail.
+        Current attempt count accessible for reporting and monitoring.
 
-        Acceptance: Maintains evaluation history (for debugging)
+        Acceptance: Tracks attempt count correctly
         """
         # Arrange
-        supervisor = SupervisorEvaluation()
-
-        # First evaluation (FAIL)
-        pod_dir_1 = tmp_path / "pod-001"
-        pod_dir_1.mkdir()
-        instructions_file_1 = pod_dir_1 / "instructions.json"
-        instructions_file_1.write_text(json.dumps({"instructions": "Task 1", "output_path": "result.json"}))
-        result_file_1 = pod_dir_1 / "result.json"
-        result_file_1.write_text(json.dumps({"result": "wrong"}))
-
-        supervisor.evaluate(pod_dir_1, pod_id="pod-001")
-
-        # Second evaluation (PASS)
-        pod_dir_2 = tmp_path / "pod-002"
-        pod_dir_2.mkdir()
-        instructions_file_2 = pod_dir_2 / "instructions.json"
-        instructions_file_2.write_text(json.dumps({"instructions": "Task 2", "output_path": "result.json"}))
-        result_file_2 = pod_dir_2 / "result.json"
-        result_file_2.write_text(json.dumps({"result": "PASS"}))
+        supervisor = supervisor_factory(current_attempt=5)
 
-        supervisor.evaluate(pod_dir_2, pod_id="pod-002")
+        # Act
+        attempt = supervisor.get_current_attempt()
 
         # Assert
-        assert len(supervisor.evaluation_history) == 2
-        assert supervisor.evaluation_history[0]["status"] == "FAIL"
-        assert supervisor.evaluation_history[1]["status"] == "PASS"
+        assert attempt == 5
 
-    def test_get_current_attempt_returns_correct_count(self, tmp_path):
+    def test_reset_clears_history_and_sets_attempt(self, pod_factory, fresh_supervisor):
         """
-        Current attempt count accessible for reporting and monitoring.
+        reset() lets one instance evaluate a new pod without stale state.
 
         Acceptance: Tracks attempt count correctly
         """
         # Arrange
-        supervisor = SupervisorEvaluation(current_attempt=5)
+        pod_dir = pod_factory("pod-001", INSTR_TASK, RESULT_FAIL)
+        supervisor = fresh_supervisor
+        supervisor.current_attempt = 2
+        supervisor.evaluate(pod_dir, pod_id="pod-001")
 
         # Act
-        attempt = supervisor.get_current_attempt()
+        supervisor.reset(current_attempt=3)
 
         # Assert
-        assert attempt == 5
+        assert supervisor.evaluation_history == []
+        assert supervisor.get_current_attempt() == 3
 
 
 class TestSupervisorEvaluationIntegration:
     """Integration tests with RequirementComparator and FeedbackManager."""
 
-    def test_supervisor_uses_comparator_for_evaluation(self, tmp_path):
+    def test_supervisor_uses_comparator_for_evaluation(self, path_only_root, monkeypatch):
         """
         SupervisorEvaluation delegates comparison to RequirementComparator.
 
         Acceptance: Integrates RequirementComparator correctly
         """
         # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Test", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "PASS"}
-        result_file.write_text(json.dumps(result_data))
+        # Comparator and feedback manager are mocked, so pod files are never needed
+        pod_dir = path_only_root / "pod-001"
 
+        mock_comp = Mock(spec=RequirementComparator)
+        mock_comp.evaluate.return_value = ("PASS", [])
         supervisor = SupervisorEvaluation()
+        supervisor.comparator = mock_comp
+        # Feedback writes are never asserted here, so a plain stub suffices
+        supervisor.feedback_manager = SimpleNamespace(
+            write_pass=lambda **kwargs: None, write_fail=lambda **kwargs: None
+        )
+        monkeypatch.setattr(supervisor, "_read_instructions", lambda pod_dir: "Do task")
+        monkeypatch.setattr(supervisor, "_read_result", lambda pod_dir: "PASS")
 
         # Act
-        with patch("src.features.supervisor_evaluation.RequirementComparator") as MockComparator:
-            mock_comp = Mock()
-            mock_comp.evaluate.return_value = ("PASS", [])
-            MockComparator.return_value = mock_comp
-
-            supervisor_with_mock = SupervisorEvaluation()
-            supervisor_with_mock.comparator = mock_comp
-
-            status = supervisor_with_mock.evaluate(pod_dir, pod_id="pod-001")
+        status = supervisor.evaluate(pod_dir, pod_id="pod-001")
 
-            # Assert comparator was called
-            mock_comp.evaluate.assert_called_once()
+        # Assert comparator was called
+        assert status == "PASS"
+        mock_comp.evaluate.assert_called_once_with("Do task", "PASS")
 
-    def test_supervisor_uses_feedback_manager_for_writing(self, tmp_path):
+    def test_supervisor_uses_feedback_manager_for_writing(self, path_only_root, monkeypatch):
         """
         SupervisorEvaluation delegates feedback writing to FeedbackManager.
 
         Acceptance: Integrates FeedbackManager correctly
         """
         # Arrange
-        pod_dir = tmp_path / "pod-001"
-        pod_dir.mkdir()
-
-        instructions_file = pod_dir / "instructions.json"
-        instructions_data = {"instructions": "Test", "output_path": "result.json"}
-        instructions_file.write_text(json.dumps(instructions_data))
-
-        result_file = pod_dir / "result.json"
-        result_data = {"result": "PASS"}
-        result_file.write_text(json.dumps(result_data))
+        # Comparator and feedback manager are mocked, so pod files are never needed
+        pod_dir = path_only_root / "pod-001"
 
+        mock_feedback = Mock(spec=FeedbackManager)
+        mock_feedback.write_pass.return_value = str(pod_dir / "feedback.json")
         supervisor = SupervisorEvaluation()
+        supervisor.feedback_manager = mock_feedback
+        # Comparator calls are never asserted here, so a plain stub suffices
+        supervisor.comparator = SimpleNamespace(evaluate=lambda instructions, result: ("PASS", []))
+        monkeypatch.setattr(supervisor, "_read_instructions", lambda pod_dir: "Do task")
+        monkeypatch.setattr(supervisor, "_read_result", lambda pod_dir: "PASS")
 
         # Act
-        with patch("src.features.supervisor_evaluation.FeedbackManager") as MockFeedback:
-            mock_feedback = Mock()
-            mock_feedback.write_pass.return_value = str(pod_dir / "feedback.json")
-            MockFeedback.return_value = mock_feedback
-
-            supervisor_with_mock = SupervisorEvaluation()
-            supervisor_with_mock.feedback_manager = mock_feedback
-            supervisor_with_mock.comparator = Mock()
-            supervisor_with_mock.comparator.evaluate.return_value = ("PASS", [])
-
-            status = supervisor_with_mock.evaluate(pod_dir, pod_id="pod-001")
+        status = supervisor.evaluate(pod_dir, pod_id="pod-001")
 
-            # Assert feedback manager was called
-            mock_feedback.write_pass.assert_called_once()
+        # Assert feedback manager was called
+        assert status == "PASS"
+        mock_feedback.write_pass.assert_called_once()
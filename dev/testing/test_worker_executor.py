@@ -11,15 +11,104 @@ Test Coverage:
 - Integration: Interaction with LLMProvider, ResultManager, and Logger
 
 Requirements tested: Issue #17 - [Sprint 2, Day 4] Component: WorkerExecutor
+
+Most tests serve instructions from memory (see ``stub_instructions``); the rest
+share only read-only session files or use their own tmp_path, so the module is
+safe to run in parallel:
+    pytest dev/testing/test_worker_executor.py -n auto --dist=loadgroup
 """
 
+import copy
 import json
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import orjson
 import pytest
+from _worker_fixtures import StubCall, instructions_bytes
 
 from src.components.worker_executor import WorkerExecutor
 
+# Payload serialized once at import
+_INVALID_LLM_CONFIG_BYTES = orjson.dumps({"invalid": "config"})
+
+
+@pytest.fixture(scope="session")
+def make_instructions(tmp_path_factory):
+    """Factory returning a session-cached instructions.json for the given text.
+
+    Each distinct text is serialized and written once; tests asking for the same
+    text share the file, so they must treat it as read-only.
+    """
+    root = tmp_path_factory.mktemp("executor_instructions")
+    paths = {}
+
+    def _make(text):
+        path = paths.get(text)
+        if path is None:
+            path = root / str(len(paths)) / "instructions.json"
+            path.parent.mkdir()
+            path.write_bytes(instructions_bytes(text))
+            paths[text] = path
+        return path
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def stub_result_path(path_only_root):
+    """Result path the stubbed ResultManager.write returns, built once."""
+    return str(path_only_root / "result.json")
+
+
+@pytest.fixture
+def stub_executor(_worker_executor_prototype):
+    """Per-test WorkerExecutor whose LLMProvider.generate and ResultManager.write are stubs.
+
+    Same wiring as the conftest ``executor`` but with StubCall instead of spec'd
+    Mock copies: these tests only set return values/side effects and check the
+    recorded calls. generate() returns "PASS" by default, like ``llm_mock``.
+    """
+    executor = copy.copy(_worker_executor_prototype)
+    executor.llm_provider = SimpleNamespace(generate=StubCall(return_value="PASS"))
+    executor.result_manager = SimpleNamespace(write=StubCall())
+    return executor
+
+
+@pytest.fixture
+def stub_instructions(stub_executor, path_only_root):
+    """Factory serving instructions from memory instead of instructions.json.
+
+    ``make(text)`` registers the parsed instructions under a dummy path and
+    returns that path as a str; the executor's _read_instructions looks it up, so no file
+    is written or read.
+    """
+    payloads = {}
+    stub_executor._read_instructions = payloads.__getitem__
+
+    def _make(text):
+        path = str(path_only_root / f"instructions-{len(payloads)}.json")
+        payloads[path] = {"instructions": text, "output_path": "result.json"}
+        return path
+
+    return _make
+
+
+@pytest.fixture
+def worker_config(path_only_root, llm_config_path):
+    """Complete worker_config for worker-001 using the session-wide llm_config.json.
+
+    ResultManager is stubbed wherever the config is used, so worker_dir never
+    needs to exist.
+    """
+    return {
+        "worker_id": "worker-001",
+        "pod_id": "pod-001",
+        "session_id": "session-001",
+        "worker_dir": str(path_only_root),
+        "llm_config_path": str(llm_config_path),
+    }
+
 
 class TestWorkerExecutorInitialization:
     """Test WorkerExecutor initialization"""
@@ -37,132 +126,75 @@ class TestWorkerExecutorInitialization:
 class TestWorkerExecutorExecute:
     """Test execute() method - main workflow"""
 
-    def test_execute_with_valid_inputs_returns_result_path(self, tmp_path):
+    def test_execute_with_valid_inputs_returns_result_path(
+        self, stub_executor, stub_result_path, stub_instructions, worker_config
+    ):
         """execute() processes valid instructions and returns result file path"""
-        # Arrange: Create instructions file
-        instructions_path = tmp_path / "instructions.json"
-        instructions_data = {
-            "instructions": "Analyze this data",
-            "output_path": "result.json",
-        }
-        instructions_path.write_text(json.dumps(instructions_data))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        # Mock LLM config file
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_data = {
-            "provider": "anthropic",
-            "model": "claude-sonnet-4",
-        }
-        llm_config_path.write_text(json.dumps(llm_config_data))
-
-        executor = WorkerExecutor()
+        # Arrange: In-memory instructions and shared LLM config
+        instructions_path = stub_instructions("Analyze this data")
 
         # Mock dependencies
-        executor.llm_provider.generate = Mock(return_value="Analysis complete")
-        executor.result_manager.write = Mock(return_value=str(tmp_path / "result.json"))
+        stub_executor.llm_provider.generate.return_value = "Analysis complete"
+        stub_executor.result_manager.write.return_value = stub_result_path
 
         # Act: Execute task
-        result_path = executor.execute(str(instructions_path), worker_config)
+        result_path = stub_executor.execute(instructions_path, worker_config)
 
         # Assert: Returns result file path
-        assert result_path == str(tmp_path / "result.json")
-        assert executor.llm_provider.generate.called
-        assert executor.result_manager.write.called
+        assert result_path == stub_result_path
+        assert stub_executor.llm_provider.generate.called
+        assert stub_executor.result_manager.write.called
 
-    def test_execute_reads_instructions_correctly(self, tmp_path):
+    def test_execute_reads_instructions_correctly(
+        self, stub_executor, stub_result_path, make_instructions, worker_config
+    ):
         """execute() reads and parses instructions.json file"""
-        # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_data = {"instructions": "Task description", "output_path": "result.json"}
-        instructions_path.write_text(json.dumps(instructions_data))
+        # Arrange: a real (session-shared, read-only) instructions.json
+        instructions_path = str(make_instructions("Task description"))
 
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        # Mock LLM config
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Result")
-        executor.result_manager.write = Mock(return_value=str(tmp_path / "result.json"))
+        stub_executor.llm_provider.generate.return_value = "Result"
+        stub_executor.result_manager.write.return_value = stub_result_path
 
         # Act
-        executor.execute(str(instructions_path), worker_config)
+        stub_executor.execute(instructions_path, worker_config)
 
         # Assert: LLM provider called with instructions
-        executor.llm_provider.generate.assert_called_once()
-        call_args = executor.llm_provider.generate.call_args
+        stub_executor.llm_provider.generate.assert_called_once()
+        call_args = stub_executor.llm_provider.generate.call_args
         assert "Task description" in str(call_args)
 
-    def test_execute_generates_valid_prompt_from_instructions(self, tmp_path):
+    def test_execute_generates_valid_prompt_from_instructions(
+        self, stub_executor, stub_result_path, stub_instructions, worker_config
+    ):
         """execute() generates proper LLM prompt from instructions"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_data = {"instructions": "Process this request", "output_path": "result.json"}
-        instructions_path.write_text(json.dumps(instructions_data))
+        instructions_path = stub_instructions("Process this request")
 
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Response")
-        executor.result_manager.write = Mock(return_value=str(tmp_path / "result.json"))
+        stub_executor.llm_provider.generate.return_value = "Response"
+        stub_executor.result_manager.write.return_value = stub_result_path
 
         # Act
-        executor.execute(str(instructions_path), worker_config)
+        stub_executor.execute(instructions_path, worker_config)
 
         # Assert: Prompt includes instructions
-        prompt = executor.llm_provider.generate.call_args[0][0]
+        prompt = stub_executor.llm_provider.generate.call_args[0][0]
         assert isinstance(prompt, str)
         assert len(prompt) > 0
         assert "Process this request" in prompt
 
-    def test_execute_calls_llm_via_provider(self, tmp_path):
+    def test_execute_calls_llm_via_provider(
+        self, stub_executor, stub_result_path, stub_instructions, worker_config
+    ):
         """execute() calls LLM through LLMProvider.generate()"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
+        instructions_path = stub_instructions("Task")
 
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
-        mock_generate = Mock(return_value="LLM Response")
-        executor.llm_provider.generate = mock_generate
-        executor.result_manager.write = Mock(return_value=str(tmp_path / "result.json"))
+        mock_generate = stub_executor.llm_provider.generate
+        mock_generate.return_value = "LLM Response"
+        stub_executor.result_manager.write.return_value = stub_result_path
 
         # Act
-        executor.execute(str(instructions_path), worker_config)
+        stub_executor.execute(instructions_path, worker_config)
 
         # Assert: LLM provider called with prompt and config
         assert mock_generate.called
@@ -170,94 +202,63 @@ class TestWorkerExecutorExecute:
         assert call_args[0][0]  # Prompt exists
         assert "config_path" in call_args[0][1]  # Provider config passed
 
-    def test_execute_writes_result_json(self, tmp_path):
+    def test_execute_writes_result_json(
+        self, stub_executor, stub_result_path, stub_instructions, worker_config
+    ):
         """execute() writes result.json through ResultManager"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
+        instructions_path = stub_instructions("Task")
 
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Task completed successfully")
-        mock_write = Mock(return_value=str(tmp_path / "result.json"))
-        executor.result_manager.write = mock_write
+        stub_executor.llm_provider.generate.return_value = "Task completed successfully"
+        mock_write = stub_executor.result_manager.write
+        mock_write.return_value = stub_result_path
 
         # Act
-        executor.execute(str(instructions_path), worker_config)
+        stub_executor.execute(instructions_path, worker_config)
 
         # Assert: ResultManager.write called with correct parameters
         mock_write.assert_called_once()
         call_args = mock_write.call_args[0]
         assert call_args[0] == "Task completed successfully"  # result
-        assert str(call_args[1]) == str(tmp_path)  # worker_dir
+        assert call_args[1] == worker_config["worker_dir"]  # worker_dir
         assert call_args[2] == "worker-001"  # worker_id
         assert call_args[3] == "pod-001"  # pod_id
         assert call_args[4] == "session-001"  # session_id
 
-    def test_execute_logs_execution_details(self, tmp_path):
+    def test_execute_logs_execution_details(
+        self, stub_executor, stub_result_path, stub_instructions, worker_config
+    ):
         """execute() logs execution start, LLM call, and completion"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
+        instructions_path = stub_instructions("Task")
 
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Response")
-        executor.result_manager.write = Mock(return_value=str(tmp_path / "result.json"))
+        stub_executor.llm_provider.generate.return_value = "Response"
+        stub_executor.result_manager.write.return_value = stub_result_path
 
         mock_logger = Mock()
-        executor.logger = mock_logger
+        stub_executor.logger = mock_logger
 
         # Act
-        executor.execute(str(instructions_path), worker_config)
+        stub_executor.execute(instructions_path, worker_config)
 
         # Assert: Logger called multiple times (start, LLM call, completion)
         assert mock_logger.info.call_count >= 2
 
-    def test_execute_returns_correct_result_file_path(self, tmp_path):
+    def test_execute_returns_correct_result_file_path(
+        self, stub_executor, path_only_root, stub_instructions, worker_config
+    ):
         """execute() returns exact path returned by ResultManager"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
+        instructions_path = stub_instructions("Task")
 
-        expected_path = str(tmp_path / "custom" / "result.json")
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path / "custom"),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
+        expected_path = str(path_only_root / "custom" / "result.json")
+        worker_config = {**worker_config, "worker_dir": str(path_only_root / "custom")}
 
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Response")
-        executor.result_manager.write = Mock(return_value=expected_path)
+        stub_executor.llm_provider.generate.return_value = "Response"
+        stub_executor.result_manager.write.return_value = expected_path
 
         # Act
-        result_path = executor.execute(str(instructions_path), worker_config)
+        result_path = stub_executor.execute(instructions_path, worker_config)
 
         # Assert
         assert result_path == expected_path
@@ -266,242 +267,151 @@ class TestWorkerExecutorExecute:
 class TestWorkerExecutorEdgeCases:
     """Test edge cases and boundary conditions"""
 
-    def test_execute_with_empty_instructions_raises_error(self, tmp_path):
+    def test_execute_with_empty_instructions_raises_error(
+        self, stub_executor, stub_instructions, worker_config
+    ):
         """execute() raises ValueError when instructions are empty"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "", "output_path": "result.json"}))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        executor = WorkerExecutor()
+        instructions_path = stub_instructions("")
 
         # Act & Assert
         with pytest.raises(ValueError, match="instructions cannot be empty|prompt cannot be empty"):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(instructions_path, worker_config)
 
-    def test_execute_with_missing_instructions_file_raises_error(self, tmp_path):
+    def test_execute_with_missing_instructions_file_raises_error(
+        self, stub_executor, path_only_root, worker_config
+    ):
         """execute() raises FileNotFoundError when instructions.json missing"""
         # Arrange
-        instructions_path = tmp_path / "nonexistent.json"
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        executor = WorkerExecutor()
+        instructions_path = path_only_root / "nonexistent.json"
 
         # Act & Assert
         with pytest.raises(FileNotFoundError):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(str(instructions_path), worker_config)
 
-    def test_execute_with_invalid_json_raises_error(self, tmp_path):
+    def test_execute_with_invalid_json_raises_error(self, stub_executor, tmp_path, worker_config):
         """execute() raises ValueError when instructions.json has invalid JSON"""
         # Arrange
         instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text("{invalid json content")
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        executor = WorkerExecutor()
+        instructions_path.write_bytes(b"{invalid json content")
 
         # Act & Assert
         with pytest.raises((json.JSONDecodeError, ValueError)):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(str(instructions_path), worker_config)
 
-    def test_execute_with_missing_worker_config_fields_raises_error(self, tmp_path):
+    def test_execute_with_missing_worker_config_fields_raises_error(
+        self, stub_executor, stub_instructions
+    ):
         """execute() raises ValueError when required worker_config fields missing"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
+        instructions_path = stub_instructions("Task")
 
         incomplete_config = {
             "worker_id": "worker-001",
             # Missing pod_id, session_id, worker_dir, llm_config_path
         }
 
-        executor = WorkerExecutor()
-
         # Act & Assert
         with pytest.raises((ValueError, KeyError)):
-            executor.execute(str(instructions_path), incomplete_config)
+            stub_executor.execute(instructions_path, incomplete_config)
 
-    def test_execute_with_very_long_instructions_succeeds(self, tmp_path):
+    def test_execute_with_very_long_instructions_succeeds(
+        self, stub_executor, stub_result_path, stub_instructions, worker_config
+    ):
         """execute() handles very long instructions (10KB+)"""
         # Arrange
         long_instructions = "Analyze this data. " * 1000  # ~20KB
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(
-            json.dumps({"instructions": long_instructions, "output_path": "result.json"})
-        )
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
+        instructions_path = stub_instructions(long_instructions)
 
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Response")
-        executor.result_manager.write = Mock(return_value=str(tmp_path / "result.json"))
+        stub_executor.llm_provider.generate.return_value = "Response"
+        stub_executor.result_manager.write.return_value = stub_result_path
 
         # Act
-        result_path = executor.execute(str(instructions_path), worker_config)
+        result_path = stub_executor.execute(instructions_path, worker_config)
 
         # Assert
         assert result_path is not None
-        assert executor.llm_provider.generate.called
+        assert stub_executor.llm_provider.generate.called
 
 
 class TestWorkerExecutorErrorHandling:
     """Test error handling and failure scenarios"""
 
-    def test_execute_handles_llm_api_errors_gracefully(self, tmp_path):
+    def test_execute_handles_llm_api_errors_gracefully(
+        self, stub_executor, stub_instructions, worker_config
+    ):
         """execute() propagates LLM API errors with proper logging"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
+        instructions_path = stub_instructions("Task")
 
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
         from src.primitives.llm_client import LLMAPIError
 
-        executor.llm_provider.generate = Mock(side_effect=LLMAPIError("API failed"))
+        stub_executor.llm_provider.generate.side_effect = LLMAPIError("API failed")
         mock_logger = Mock()
-        executor.logger = mock_logger
+        stub_executor.logger = mock_logger
 
         # Act & Assert
         with pytest.raises(LLMAPIError):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(instructions_path, worker_config)
 
         # Verify error was logged
         assert mock_logger.error.called
 
-    def test_execute_handles_rate_limit_errors(self, tmp_path):
+    def test_execute_handles_rate_limit_errors(
+        self, stub_executor, stub_instructions, worker_config
+    ):
         """execute() propagates rate limit errors from LLM provider"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
+        instructions_path = stub_instructions("Task")
 
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
         from src.primitives.llm_client import RateLimitError
 
-        executor.llm_provider.generate = Mock(side_effect=RateLimitError("Rate limit exceeded"))
+        stub_executor.llm_provider.generate.side_effect = RateLimitError("Rate limit exceeded")
 
         # Act & Assert
         with pytest.raises(RateLimitError):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(instructions_path, worker_config)
 
-    def test_execute_handles_timeout_errors(self, tmp_path):
+    def test_execute_handles_timeout_errors(self, stub_executor, stub_instructions, worker_config):
         """execute() propagates timeout errors from LLM provider"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
+        instructions_path = stub_instructions("Task")
 
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
-
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
         from src.primitives.llm_client import TimeoutError as LLMTimeoutError
 
-        executor.llm_provider.generate = Mock(side_effect=LLMTimeoutError("Request timed out"))
+        stub_executor.llm_provider.generate.side_effect = LLMTimeoutError("Request timed out")
 
         # Act & Assert
         with pytest.raises(LLMTimeoutError):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(instructions_path, worker_config)
 
-    def test_execute_handles_result_write_failures(self, tmp_path):
+    def test_execute_handles_result_write_failures(
+        self, stub_executor, stub_instructions, worker_config
+    ):
         """execute() propagates errors from ResultManager.write()"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
+        instructions_path = stub_instructions("Task")
 
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(return_value="Response")
-        executor.result_manager.write = Mock(side_effect=ValueError("Write failed"))
+        stub_executor.llm_provider.generate.return_value = "Response"
+        stub_executor.result_manager.write.side_effect = ValueError("Write failed")
 
         # Act & Assert
         with pytest.raises(ValueError, match="Write failed"):
-            executor.execute(str(instructions_path), worker_config)
+            stub_executor.execute(instructions_path, worker_config)
 
-    def test_execute_handles_invalid_llm_config(self, tmp_path):
+    def test_execute_handles_invalid_llm_config(self, tmp_path, make_instructions, worker_config):
         """execute() raises error when LLM config is invalid"""
         # Arrange
-        instructions_path = tmp_path / "instructions.json"
-        instructions_path.write_text(json.dumps({"instructions": "Task", "output_path": "result.json"}))
-
-        worker_config = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
+        instructions_path = make_instructions("Task")
 
-        # Invalid LLM config (missing required fields)
+        # Invalid LLM config (missing required fields) - unique to this test
         llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"invalid": "config"}))
+        llm_config_path.write_bytes(_INVALID_LLM_CONFIG_BYTES)
+        worker_config = {**worker_config, "llm_config_path": str(llm_config_path)}
 
+        # Real LLMProvider needed; it raises before anything is written. A fresh
+        # executor, so its provider's config cache never reaches the session
+        # prototype other tests copy
         executor = WorkerExecutor()
 
         # Act & Assert
@@ -512,63 +422,47 @@ class TestWorkerExecutorErrorHandling:
 class TestWorkerExecutorStateless:
     """Test that WorkerExecutor is stateless"""
 
-    def test_executor_has_no_instance_state(self):
+    def test_executor_has_no_instance_state(self, stub_executor):
         """WorkerExecutor stores no state between calls"""
-        executor = WorkerExecutor()
 
         # Verify no state-related attributes
         instance_vars = [
             attr
-            for attr in dir(executor)
-            if not attr.startswith("_") and not callable(getattr(executor, attr))
+            for attr in dir(stub_executor)
+            if not attr.startswith("_") and not callable(getattr(stub_executor, attr))
         ]
 
         # Should only have dependency objects, no state
         for var in instance_vars:
-            attr = getattr(executor, var)
+            attr = getattr(stub_executor, var)
             # Dependencies are ok (LLMProvider, ResultManager, Logger)
             assert hasattr(attr, "__class__")
 
-    def test_multiple_executions_are_independent(self, tmp_path):
+    def test_multiple_executions_are_independent(
+        self, stub_executor, path_only_root, stub_instructions, worker_config
+    ):
         """Multiple execute() calls don't affect each other"""
         # Arrange
-        executor = WorkerExecutor()
-        executor.llm_provider.generate = Mock(side_effect=["Response 1", "Response 2"])
-        executor.result_manager.write = Mock(
-            side_effect=[str(tmp_path / "result1.json"), str(tmp_path / "result2.json")]
-        )
+        stub_executor.llm_provider.generate.side_effect = ["Response 1", "Response 2"]
+        result_paths = [str(path_only_root / "result1.json"), str(path_only_root / "result2.json")]
+        stub_executor.result_manager.write.side_effect = result_paths
 
-        # Create two sets of instructions
-        instructions1 = tmp_path / "instructions1.json"
-        instructions1.write_text(json.dumps({"instructions": "Task 1", "output_path": "result.json"}))
-
-        instructions2 = tmp_path / "instructions2.json"
-        instructions2.write_text(json.dumps({"instructions": "Task 2", "output_path": "result.json"}))
-
-        worker_config1 = {
-            "worker_id": "worker-001",
-            "pod_id": "pod-001",
-            "session_id": "session-001",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
-        }
+        # Two sets of instructions
+        instructions1 = stub_instructions("Task 1")
+        instructions2 = stub_instructions("Task 2")
 
+        worker_config1 = worker_config
         worker_config2 = {
+            **worker_config,
             "worker_id": "worker-002",
             "pod_id": "pod-002",
             "session_id": "session-002",
-            "worker_dir": str(tmp_path),
-            "llm_config_path": str(tmp_path / "llm_config.json"),
         }
 
-        llm_config_path = tmp_path / "llm_config.json"
-        llm_config_path.write_text(json.dumps({"provider": "anthropic", "model": "claude"}))
-
         # Act
-        result1 = executor.execute(str(instructions1), worker_config1)
-        result2 = executor.execute(str(instructions2), worker_config2)
+        result1 = stub_executor.execute(instructions1, worker_config1)
+        result2 = stub_executor.execute(instructions2, worker_config2)
 
         # Assert: Both executions succeeded independently
-        assert result1 == str(tmp_path / "result1.json")
-        assert result2 == str(tmp_path / "result2.json")
-        assert executor.llm_provider.generate.call_count == 2
+        assert [result1, result2] == result_paths
+        assert stub_executor.llm_provider.generate.call_count == 2
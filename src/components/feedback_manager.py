@@ -9,6 +9,7 @@ Composition:
 - TimestampGenerator (primitive #7) - ISO 8601 timestamps
 """
 
+import os
 from pathlib import Path
 
 from src.primitives.file_writer import FileWriter
@@ -19,6 +20,8 @@ from src.primitives.timestamp_generator import TimestampGenerator
 class FeedbackManager:
     """Manage feedback file lifecycle in pod directories"""
 
+    __slots__ = ("file_writer", "validator", "timestamp_generator")
+
     def __init__(self):
         """Initialize FeedbackManager with required primitives"""
         self.file_writer = FileWriter()
@@ -37,7 +40,7 @@ class FeedbackManager:
         """
         return {"timestamp": self.timestamp_generator.now(), "pod_id": pod_id}
 
-    def write_pass(self, result: str, attempts: int, pod_dir: Path, pod_id: str) -> str:
+    def write_pass(self, result: str, attempts: int, pod_dir: Path | str, pod_id: str) -> str:
         """
         Write PASS feedback to pod directory.
 
@@ -53,9 +56,10 @@ class FeedbackManager:
         data = self._create_base_feedback(pod_id)
         data.update({"status": "PASS", "result": result, "attempts": attempts})
 
-        return self._write_feedback(data, pod_dir)
+        # Built here from the schema's own keys, so the schema pass is skipped
+        return self._write_feedback(data, pod_dir, validate=False)
 
-    def write_fail(self, gaps: list[str], attempt: int, pod_dir: Path, pod_id: str) -> str:
+    def write_fail(self, gaps: list[str], attempt: int, pod_dir: Path | str, pod_id: str) -> str:
         """
         Write FAIL feedback to pod directory.
 
@@ -71,15 +75,34 @@ class FeedbackManager:
         data = self._create_base_feedback(pod_id)
         data.update({"status": "FAIL", "gaps": gaps, "attempt": attempt})
 
+        # Built here from the schema's own keys, so the schema pass is skipped
+        return self._write_feedback(data, pod_dir, validate=False)
+
+    def write_raw(self, data: dict, pod_dir: Path | str) -> str:
+        """
+        Validate externally built feedback data and write it to pod directory.
+
+        Args:
+            data: Feedback data dictionary (PASS or FAIL schema)
+            pod_dir: Pod directory path
+
+        Returns:
+            str: Path to written feedback.json file
+
+        Raises:
+            ValueError: If validation fails
+        """
         return self._write_feedback(data, pod_dir)
 
-    def _write_feedback(self, data: dict, pod_dir: Path) -> str:
+    def _write_feedback(self, data: dict, pod_dir: Path | str, validate: bool = True) -> str:
         """
         Validate and write feedback data to pod directory.
 
         Args:
             data: Feedback data dictionary
             pod_dir: Pod directory path
+            validate: Run schema validation (False only for dicts built by
+                write_pass/write_fail)
 
         Returns:
             str: Path to written feedback.json file
@@ -88,13 +111,15 @@ class FeedbackManager:
             ValueError: If validation fails
         """
         # Validate schema before writing to prevent invalid data persistence
-        is_valid, errors = self.validator.validate_feedback(data)
-        if not is_valid:
-            error_msg = ", ".join(errors)
-            raise ValueError(f"Feedback validation failed: {error_msg}")
+        if validate:
+            is_valid, errors = self.validator.validate_feedback(data)
+            if not is_valid:
+                error_msg = ", ".join(errors)
+                raise ValueError(f"Feedback validation failed: {error_msg}")
 
         # Write atomically to prevent partial file visibility during write
-        feedback_file_path = str(pod_dir / "feedback.json")
+        # (plain string join; Path arithmetic is measurably slower per call)
+        feedback_file_path = os.path.join(os.fspath(pod_dir), "feedback.json")
         self.file_writer.write_atomic(feedback_file_path, data)
 
         return feedback_file_path
@@ -13,23 +13,89 @@ Issue: #12 - [Sprint 2, Day 1] Component: InstructionManager
 TDD Phase: REFACTOR - Code quality improvements completed
 """
 
+import functools
+import os
+import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
+
 from src.primitives.file_writer import FileWriter
 from src.primitives.json_validator import JSONValidator
 from src.primitives.path_resolver import PathResolver
 from src.primitives.timestamp_generator import TimestampGenerator
 
+# Only macOS has the /var -> /private/var symlink that _normalize_path undoes
+_IS_MACOS = sys.platform == "darwin"
+
+# Pods whose metadata stays cached; least recently written pods are dropped
+# first, so a long-running process does not keep one entry per pod forever
+_TEMPLATE_CACHE_SIZE = 256
+
+# Fixed pool of in-process write locks shared by pod_dir hash; bounded no
+# matter how many pods a process creates, at the cost of unrelated pods
+# occasionally waiting on the same lock
+_WRITE_LOCK_STRIPES = 64
+
+# LELA_MULTIPROCESS values that switch create() to flock-based writes; any
+# other value (including "0"/"false") or an unset variable leaves it off
+_ENABLED_FLAG_VALUES = frozenset({"1", "true", "yes", "on"})
+
+# instructions.json has a fixed schema, so the document is formatted straight
+# from JSON-encoded field values; the layout matches FileWriter's 2-space indent
+_INSTRUCTIONS_TEMPLATE = (
+    b'{\n  "instructions": %s,\n  "output_path": %s,\n  "pod_id": %s,'
+    b'\n  "session_id": %s,\n  "project_root": %s,\n  "timestamp": %s\n}'
+)
+
+
+@dataclass(slots=True, frozen=True)
+class InstructionPayload:
+    """Contents of one instructions.json (serialized via _INSTRUCTIONS_TEMPLATE)."""
+
+    instructions: str
+    pod_id: str
+    session_id: str
+    project_root: str
+    timestamp: str
+    output_path: str = "result.json"
+
 
 class InstructionManager:
     """Manages instruction file lifecycle with validation and metadata."""
 
+    __slots__ = (
+        "writer",
+        "validator",
+        "timestamp_gen",
+        "path_resolver",
+        "_cached_pod_template",
+        "_write_locks",
+        "_multiprocess",
+    )
+
     def __init__(self):
         """Initialize InstructionManager with required primitives."""
         self.writer = FileWriter()
         self.validator = JSONValidator()
         self.timestamp_gen = TimestampGenerator()
         self.path_resolver = PathResolver()
+        # pod_dir -> (pod_id, normalized project_root); neither changes between
+        # instruction writes, so the upward marker search and normalization
+        # run once per pod (bounded LRU, thread-safe)
+        self._cached_pod_template = functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)(
+            self._pod_template
+        )
+        # In-process write locks, picked by pod_dir (see _pod_lock); they
+        # serialize this process's atomic instructions.json writes in place of
+        # flock (see create())
+        self._write_locks = tuple(threading.Lock() for _ in range(_WRITE_LOCK_STRIPES))
+        # Read once: whether other processes may write the same pods
+        self._multiprocess = (
+            os.environ.get("LELA_MULTIPROCESS", "").strip().lower() in _ENABLED_FLAG_VALUES
+        )
 
     def _normalize_path(self, path: Path) -> str:
         """
@@ -44,36 +110,59 @@ class InstructionManager:
         Returns:
             str: Normalized path string
         """
-        path_str = str(path)
-        # Normalize macOS /private/var symlink to /var
-        if path_str.startswith("/private/var/"):
-            return path_str.replace("/private/var/", "/var/", 1)
+        path_str = os.fspath(path)
+        # Normalize macOS /private/var symlink to /var by dropping "/private"
+        if _IS_MACOS and path_str.startswith("/private/var/"):
+            return path_str[len("/private") :]
         return path_str
 
-    def _build_instruction_data(self, instructions: str, pod_dir: Path, session_id: str) -> dict:
+    def _pod_template(self, pod_dir: Path) -> tuple[str, str]:
         """
-        Build instruction data dictionary with metadata.
+        Build the per-pod part of the instruction metadata.
+
+        Called through _cached_pod_template, which caches it per pod_dir.
 
         Args:
-            instructions: Instruction text
             pod_dir: Path to pod directory
-            session_id: Session identifier
 
         Returns:
-            dict: Complete instruction data with metadata
+            tuple[str, str]: pod_id and normalized project_root
         """
-        pod_id = pod_dir.name
         project_root = self.path_resolver.get_project_root(pod_dir)
-        timestamp = self.timestamp_gen.now()
+        return (pod_dir.name, self._normalize_path(project_root))
+
+    def _pod_lock(self, pod_dir: Path | str) -> threading.Lock:
+        """
+        Get the in-process write lock for a pod directory.
 
-        return {
-            "instructions": instructions,
-            "output_path": "result.json",
-            "pod_id": pod_id,
-            "session_id": session_id,
-            "project_root": self._normalize_path(project_root),
-            "timestamp": timestamp,
-        }
+        Args:
+            pod_dir: Path to pod directory (str and Path forms share a lock)
+
+        Returns:
+            threading.Lock: Lock serializing instruction writes for this pod
+                (shared with the other pods that hash to the same stripe)
+        """
+        return self._write_locks[hash(os.fspath(pod_dir)) % _WRITE_LOCK_STRIPES]
+
+    def _build_instruction_data(
+        self, instructions: str, pod_dir: Path, session_id: str
+    ) -> InstructionPayload:
+        """
+        Build instruction data with metadata.
+
+        Args:
+            instructions: Instruction text
+            pod_dir: Path to pod directory
+            session_id: Session identifier
+
+        Returns:
+            InstructionPayload: Complete instruction data with metadata
+        """
+        # Only the per-call fields are added to the cached per-pod template
+        pod_id, project_root = self._cached_pod_template(pod_dir)
+        return InstructionPayload(
+            instructions, pod_id, session_id, project_root, self.timestamp_gen.now()
+        )
 
     def create(self, instructions: str, pod_dir: Path, session_id: str) -> str:
         """
@@ -100,14 +189,33 @@ class InstructionManager:
         # Build instruction data with metadata
         data = self._build_instruction_data(instructions, pod_dir, session_id)
 
-        # Validate complete data structure against schema
-        is_valid, errors = self.validator.validate_instructions(data)
+        # Validate against schema; it only constrains instructions and
+        # output_path, so only those are put in a dict for jsonschema
+        is_valid, errors = self.validator.validate_instructions(
+            {"instructions": data.instructions, "output_path": data.output_path}
+        )
         if not is_valid:
             error_details = "; ".join(errors)
             raise ValueError(f"Instruction validation failed: {error_details}")
 
-        # Write atomically to instructions.json
-        file_path = pod_dir / "instructions.json"
-        self.writer.write_with_lock(str(file_path), data)
-
-        return str(file_path)
+        payload = _INSTRUCTIONS_TEMPLATE % (
+            orjson.dumps(data.instructions),
+            orjson.dumps(data.output_path),
+            orjson.dumps(data.pod_id),
+            orjson.dumps(data.session_id),
+            orjson.dumps(data.project_root),
+            orjson.dumps(data.timestamp),
+        )
+
+        # Write to instructions.json. Workers in other processes read it, so
+        # the default write replaces the file atomically (readers never see a
+        # truncated or partial file) under a per-pod thread lock; flock-based
+        # writes are opt-in via LELA_MULTIPROCESS (read in __init__)
+        file_path = os.path.join(os.fspath(pod_dir), "instructions.json")
+        if self._multiprocess:
+            self.writer.write_bytes_with_lock(file_path, payload)
+        else:
+            with self._pod_lock(pod_dir):
+                self.writer.write_bytes_atomic(file_path, payload)
+
+        return file_path
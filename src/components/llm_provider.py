@@ -13,7 +13,8 @@ Interface:
 - generate(prompt: str, provider_config: dict) -> str
 - validate_config(config: dict) -> tuple[bool, list[str]]
 
-State: Stateless (uses config per call)
+State: Stateless per call; validated configs and their resolved API keys are
+cached per config_path and reloaded when the file changes
 """
 
 import os
@@ -30,10 +31,15 @@ class LLMProvider:
     DEFAULT_TIMEOUT = 30  # Default LLM call timeout in seconds
 
     def __init__(self):
-        """Initialize LLMProvider (stateless, no instance state)"""
+        """Initialize LLMProvider (no per-call state; only a config cache)"""
         self.llm_client = LLMClient()
         self.config_loader = ConfigLoader()
         self.logger = logger.Logger()
+        # config_path -> ((st_mtime_ns, st_size), validated config, API key);
+        # agents loop over many prompts with one config file, so it is parsed,
+        # validated and its API key resolved once, and only reloaded when the
+        # file changes
+        self._config_cache: dict[str, tuple[tuple[int, int], dict[str, Any], str | None]] = {}
 
     def _validate_prompt(self, prompt: str) -> None:
         """
@@ -48,26 +54,47 @@ class LLMProvider:
         if not prompt or (isinstance(prompt, str) and len(prompt.strip()) == 0):
             raise ValueError("Prompt cannot be empty")
 
-    def _load_and_validate_config(self, config_path: str) -> dict[str, Any]:
+    def _load_config(self, config_path: str) -> tuple[dict[str, Any], str | None]:
         """
-        Load config from file and validate it
+        Load and validate config and resolve its API key, cached until the file changes
+
+        The API key environment variable is read on the first load only, so a
+        changed variable is picked up once the config file changes.
 
         Args:
             config_path: Path to configuration file
 
         Returns:
-            Validated configuration dictionary
+            Tuple of (validated configuration dictionary, API key or None)
 
         Raises:
-            ValueError: If config is invalid
+            ValueError: If config is invalid or its API key variable is not defined
         """
+        # One stat() instead of a read + parse + validate; a missing file is left
+        # to ConfigLoader so it reports its usual error
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            stamp = None
+        else:
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = self._config_cache.get(config_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1], cached[2]
+
         config = self.config_loader.load(config_path)
         is_valid, errors = self.validate_config(config)
         if not is_valid:
             error_msg = f"Config validation failed: {'; '.join(errors)}"
             self.logger.error(error_msg, context={"errors": errors, "config_path": config_path})
             raise ValueError(error_msg)
-        return config
+
+        # Resolved before caching, so a missing variable is reported again next call
+        api_key = self._resolve_api_key(config)
+
+        if stamp is not None:
+            self._config_cache[config_path] = (stamp, config, api_key)
+        return config, api_key
 
     def _resolve_api_key(self, config: dict[str, Any]) -> str | None:
         """
@@ -109,32 +136,6 @@ class LLMProvider:
             "timeout": config.get("timeout", self.DEFAULT_TIMEOUT),
         }
 
-    def _build_log_context(
-        self, prompt: str, config: dict[str, Any], response: str | None = None, error: str | None = None
-    ) -> dict[str, Any]:
-        """
-        Build logging context dictionary
-
-        Args:
-            prompt: The prompt text
-            config: LLM configuration
-            response: Optional response text
-            error: Optional error message
-
-        Returns:
-            Dictionary with logging context
-        """
-        context = {
-            "prompt": prompt,
-            "provider": config["provider"],
-            "model": config["model"],
-        }
-        if response is not None:
-            context["response"] = response
-        if error is not None:
-            context["error"] = error
-        return context
-
     def validate_config(self, config: dict[str, Any]) -> tuple[bool, list[str]]:
         """
         Validate LLM configuration
@@ -194,33 +195,35 @@ class LLMProvider:
         if not config_path:
             raise ValueError("Missing required parameter: 'config_path'")
 
-        # Load and validate configuration
-        config = self._load_and_validate_config(config_path)
-
-        # Resolve API key from environment
-        api_key = self._resolve_api_key(config)
+        # Load and validate configuration, resolving the API key from environment
+        config, api_key = self._load_config(config_path)
 
         # Build LLMClient configuration
         llm_config = self._build_llm_config(config, api_key)
 
+        # Logging context shared by every log event of this call; info events
+        # are skipped (and their contexts never built) when info is filtered out
+        log_context = {"prompt": prompt, "provider": config["provider"], "model": config["model"]}
+        log_info = self.logger.is_enabled_for("info")
+
         # Log the LLM call before making it
-        self.logger.info("Making LLM call", context=self._build_log_context(prompt, config))
+        if log_info:
+            self.logger.info("Making LLM call", context=log_context)
 
         # Call LLM
         try:
             response = self.llm_client.call(prompt, config=llm_config)
 
             # Log successful response
-            self.logger.info(
-                "LLM call successful", context=self._build_log_context(prompt, config, response=response)
-            )
+            if log_info:
+                self.logger.info(
+                    "LLM call successful", context={**log_context, "response": response}
+                )
 
             return response
 
         except (LLMAPIError, RateLimitError, TimeoutError) as e:
             # Log error
-            self.logger.error(
-                "LLM call failed", context=self._build_log_context(prompt, config, error=str(e))
-            )
+            self.logger.error("LLM call failed", context={**log_context, "error": str(e)})
             # Re-raise exception (no silent failures)
             raise
@@ -22,12 +22,12 @@ Refactorings Applied:
 - Removed redundant variable assignment (prompt = instructions)
 """
 
-import json
 from pathlib import Path
 
 from src.components.llm_provider import LLMProvider
 from src.components.result_manager import ResultManager
 from src.primitives import logger
+from src.primitives.file_reader import loads_json
 
 
 class WorkerExecutor:
@@ -113,12 +113,13 @@ class WorkerExecutor:
             FileNotFoundError: If instructions file doesn't exist
             json.JSONDecodeError: If JSON is invalid
         """
-        instructions_file = Path(instructions_path)
-        if not instructions_file.exists():
-            raise FileNotFoundError(f"Instructions file not found: {instructions_path}")
+        # EAFP: one open+read instead of a stat() followed by open+read
+        try:
+            content = Path(instructions_path).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Instructions file not found: {instructions_path}") from None
 
-        instructions_text = instructions_file.read_text()
-        return json.loads(instructions_text)
+        return loads_json(content)
 
     def _extract_instructions(self, instructions_data: dict) -> str:
         """
@@ -61,25 +61,8 @@ class SupervisorEvaluation:
             ValueError: If instructions.json is malformed
             json.JSONDecodeError: If instructions.json contains invalid JSON
         """
-        # Read instructions
-        instructions_file = pod_dir / "instructions.json"
-        if not instructions_file.exists():
-            raise FileNotFoundError(f"Instructions file not found: {instructions_file}")
-
-        try:
-            instructions_data = json.loads(instructions_file.read_text())
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Malformed instructions file: {e}")
-
-        instructions = instructions_data.get("instructions", "")
-
-        # Read result (handle missing file gracefully)
-        result_file = pod_dir / "result.json"
-        result: Optional[str] = None
-
-        if result_file.exists():
-            result_data = json.loads(result_file.read_text())
-            result = result_data.get("result", "")
+        instructions = self._read_instructions(pod_dir)
+        result = self._read_result(pod_dir)
 
         # Evaluate using comparator
         status, gaps = self.comparator.evaluate(instructions, result)
@@ -133,6 +116,58 @@ class SupervisorEvaluation:
 
         return status
 
+    def _read_instructions(self, pod_dir: Path) -> str:
+        """
+        Read the instructions text from pod_dir/instructions.json.
+
+        Args:
+            pod_dir: Pod directory containing instructions.json
+
+        Returns:
+            str: Instructions text ("" if the key is absent)
+
+        Raises:
+            FileNotFoundError: If instructions.json doesn't exist
+            ValueError: If instructions.json is malformed
+        """
+        instructions_file = pod_dir / "instructions.json"
+        if not instructions_file.exists():
+            raise FileNotFoundError(f"Instructions file not found: {instructions_file}")
+
+        try:
+            instructions_data = json.loads(instructions_file.read_text())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed instructions file: {e}")
+
+        return instructions_data.get("instructions", "")
+
+    def _read_result(self, pod_dir: Path) -> Optional[str]:
+        """
+        Read the result text from pod_dir/result.json.
+
+        Args:
+            pod_dir: Pod directory that may contain result.json
+
+        Returns:
+            Optional[str]: Result text, or None if result.json doesn't exist
+        """
+        result_file = pod_dir / "result.json"
+        if not result_file.exists():
+            return None
+
+        result_data = json.loads(result_file.read_text())
+        return result_data.get("result", "")
+
+    def reset(self, current_attempt: int = 0) -> None:
+        """
+        Reset per-pod state so the instance can evaluate a new pod.
+
+        Args:
+            current_attempt: Number of previous attempts (default: 0 for first attempt)
+        """
+        self.evaluation_history.clear()
+        self.current_attempt = current_attempt
+
     def get_current_attempt(self) -> int:
         """
         Get current attempt count.
@@ -5,8 +5,42 @@ Refactor Phase - Clean, maintainable implementation.
 """
 
 import json
+import re
 from pathlib import Path
 
+import orjson
+
+# A digit run this long may be an integer wider than 64 bits, which orjson
+# returns as a float; documents containing one are parsed by the stdlib
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+_LONG_DIGITS_STR = re.compile(r"[0-9]{19}")
+
+
+def loads_json(content: bytes | str):
+    """
+    Parse a JSON document with the same results as json.loads.
+
+    orjson handles the common case. Documents it rejects but the stdlib
+    accepts (NaN, Infinity, lone surrogates), and documents with a long digit
+    run that could be a wide integer, are parsed with json.loads instead.
+
+    Args:
+        content: JSON document as UTF-8 bytes or str
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    pattern = _LONG_DIGITS_BYTES if isinstance(content, bytes) else _LONG_DIGITS_STR
+    if pattern.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 class FileReader:
     """Reads JSON files and returns structured data."""
@@ -37,13 +71,18 @@ class FileReader:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If JSON is malformed
         """
-        path = self._to_path(file_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # EAFP: one open+read instead of a stat() followed by open+read
+        try:
+            content = self._to_path(file_path).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        try:
+            return loads_json(content)
+        except json.JSONDecodeError as e:
+            # Name the file so config errors are actionable
+            message = f"Invalid JSON in {file_path}: {e.msg}"
+            raise json.JSONDecodeError(message, e.doc, e.pos) from None
 
     def exists(self, file_path: str) -> bool:
         """
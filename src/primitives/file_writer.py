@@ -6,10 +6,58 @@ Green Phase - Minimum viable implementation to pass all tests.
 
 import fcntl
 import json
+import math
 import os
 import tempfile
 from pathlib import Path
 
+import orjson
+
+
+def _has_non_finite_float(value) -> bool:
+    """
+    Check whether a JSON-bound value contains a NaN or infinite float.
+
+    Args:
+        value: Value to scan (dicts and lists are walked recursively)
+
+    Returns:
+        bool: True if any float in value is NaN or infinite
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def dumps_json(data) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes with 2-space indentation.
+
+    Produces what json.dumps(data, ensure_ascii=False, indent=2) would, so the
+    output reads back with json.loads. orjson handles the common case; data
+    with NaN or infinite floats (which orjson writes as null) or values orjson
+    cannot encode (such as integers wider than 64 bits) go through json.dumps.
+
+    Args:
+        data: Value to serialize
+
+    Returns:
+        bytes: Encoded JSON document
+
+    Raises:
+        TypeError: If data contains values that are not JSON serializable
+    """
+    if not _has_non_finite_float(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class FileWriter:
     """Writes JSON files with atomic write support."""
@@ -35,15 +83,20 @@ class FileWriter:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _dump_json(self, data: dict, file_handle) -> None:
+    def _serialize(self, data: dict) -> bytes:
         """
-        Serialize dict to JSON and write to file handle.
+        Serialize dict to UTF-8 JSON bytes with 2-space indentation.
 
         Args:
             data: Dictionary to serialize
-            file_handle: Open file handle to write to
+
+        Returns:
+            bytes: Encoded JSON document (see dumps_json)
+
+        Raises:
+            TypeError: If data contains values that are not JSON serializable
         """
-        json.dump(data, file_handle, ensure_ascii=False, indent=2)
+        return dumps_json(data)
 
     def write(self, file_path: str, data: dict) -> bool:
         """
@@ -58,15 +111,31 @@ class FileWriter:
         Returns:
             bool: True if write successful
 
+        Raises:
+            PermissionError: If cannot write to location
+        """
+        return self.write_bytes(file_path, self._serialize(data))
+
+    def write_bytes(self, file_path: str, payload: bytes) -> bool:
+        """
+        Write pre-encoded JSON bytes to file.
+
+        Creates parent directories if they don't exist.
+
+        Args:
+            file_path: Path to write the JSON file
+            payload: Encoded JSON document
+
+        Returns:
+            bool: True if write successful
+
         Raises:
             PermissionError: If cannot write to location
         """
         path = self._to_path(file_path)
         self._ensure_parent_dirs(path)
 
-        # Write JSON with UTF-8 encoding
-        with open(path, "w", encoding="utf-8") as f:
-            self._dump_json(data, f)
+        path.write_bytes(payload)
 
         return True
 
@@ -84,6 +153,28 @@ class FileWriter:
         Returns:
             bool: True if write successful
 
+        Raises:
+            PermissionError: If cannot write to location
+        """
+        # Serialize first so an encoding error never leaves a temp file behind
+        return self.write_bytes_atomic(file_path, self._serialize(data))
+
+    def write_bytes_atomic(self, file_path: str, payload: bytes) -> bool:
+        """
+        Write pre-encoded JSON bytes to file atomically.
+
+        Same temp file + rename semantics as write_atomic(), for callers that
+        build their own JSON payload. Readers in any process see either the
+        previous file or the complete new one.
+        Creates parent directories if they don't exist.
+
+        Args:
+            file_path: Path to write the JSON file
+            payload: Encoded JSON document
+
+        Returns:
+            bool: True if write successful
+
         Raises:
             PermissionError: If cannot write to location
         """
@@ -96,8 +187,8 @@ class FileWriter:
 
         try:
             # Write JSON to temp file
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                self._dump_json(data, f)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
 
             # Atomic rename
             os.rename(temp_path, path)
@@ -126,6 +217,27 @@ class FileWriter:
         Returns:
             bool: True if write successful
 
+        Raises:
+            PermissionError: If cannot write to location
+        """
+        # Serialize before locking to keep the critical section short
+        return self.write_bytes_with_lock(file_path, self._serialize(data))
+
+    def write_bytes_with_lock(self, file_path: str, payload: bytes) -> bool:
+        """
+        Write pre-encoded JSON bytes to file with file locking.
+
+        Same locking semantics as write_with_lock(), for callers that build
+        their own JSON payload.
+        Creates parent directories if they don't exist.
+
+        Args:
+            file_path: Path to write the JSON file
+            payload: Encoded JSON document
+
+        Returns:
+            bool: True if write successful
+
         Raises:
             PermissionError: If cannot write to location
         """
@@ -134,7 +246,7 @@ class FileWriter:
 
         # Open file in read-write mode to allow locking before truncation
         # Use 'a+' to create file if doesn't exist, then we'll truncate after lock
-        with open(path, "a+", encoding="utf-8") as f:
+        with open(path, "a+b") as f:
             try:
                 # Acquire exclusive lock (blocks until available)
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
@@ -143,8 +255,11 @@ class FileWriter:
                 f.seek(0)
                 f.truncate()
 
-                # Write JSON while lock is held
-                self._dump_json(data, f)
+                # Write JSON while lock is held; flush before unlocking, or the
+                # buffered bytes would only reach the file on close, after
+                # LOCK_UN, racing the next writer's truncate
+                f.write(payload)
+                f.flush()
 
             finally:
                 # Release lock (happens automatically when file closes,
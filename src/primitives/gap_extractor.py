@@ -6,6 +6,7 @@ Purpose: Parse instruction requirements and extract gaps with binary PASS/FAIL e
 """
 
 import re
+from collections.abc import Iterable
 from typing import Optional
 
 
@@ -65,18 +66,7 @@ class GapExtractor:
             >>> len(gaps) > 0
             True
         """
-        gaps = []
-
-        # Check each requirement against the result
-        for requirement in requirements:
-            # Extract key terms from requirement
-            key_terms = self._extract_key_terms(requirement)
-
-            # Check if result satisfies requirement
-            if not self._requirement_satisfied(requirement, key_terms, result):
-                gaps.append(f"Missing requirement: {requirement}")
-
-        return gaps
+        return self._gaps(requirements, result)
 
     def extract_requirements(self, instructions: str) -> list[str]:
         """
@@ -105,6 +95,55 @@ class GapExtractor:
 
         return requirements
 
+    def analyze(self, instructions: str, result: str) -> list[str]:
+        """
+        Extract requirements from instructions and find their gaps in one pass.
+
+        Same gaps as find_gaps(extract_requirements(instructions), result), but
+        each instruction line is checked as it is cleaned and the result is
+        lowercased once, instead of building the requirement list first.
+
+        Args:
+            instructions: Multi-line instruction string (may contain numbered steps)
+            result: The actual result to compare against
+
+        Returns:
+            List of specific gap descriptions (empty if no requirement is missing)
+
+        Examples:
+            >>> extractor = GapExtractor()
+            >>> extractor.analyze("1. Calculate sum\\n2. Return as integer", "The sum is 4")
+            ['Missing requirement: Return as integer']
+        """
+        lines = instructions.strip().split("\n")
+        requirements = (self._clean_requirement_line(line) for line in lines)
+
+        return self._gaps((requirement for requirement in requirements if requirement), result)
+
+    def _gaps(self, requirements: Iterable[str], result: str) -> list[str]:
+        """
+        Check each requirement against the result.
+
+        Args:
+            requirements: Discrete requirements (consumed once)
+            result: The actual result to compare against
+
+        Returns:
+            List of "Missing requirement" gap descriptions
+        """
+        result_lower = result.lower()
+        gaps = []
+
+        for requirement in requirements:
+            # Extract key terms from requirement
+            key_terms = self._extract_key_terms(requirement)
+
+            # Check if result satisfies requirement
+            if not self._requirement_satisfied(requirement, key_terms, result, result_lower):
+                gaps.append(f"Missing requirement: {requirement}")
+
+        return gaps
+
     def _clean_requirement_line(self, line: str) -> str:
         """
         Clean a single requirement line by removing whitespace and numbering.
@@ -143,7 +182,9 @@ class GapExtractor:
 
         return key_terms
 
-    def _requirement_satisfied(self, requirement: str, key_terms: list[str], result: str) -> bool:
+    def _requirement_satisfied(
+        self, requirement: str, key_terms: list[str], result: str, result_lower: str
+    ) -> bool:
         """
         Check if a requirement is satisfied by the result.
 
@@ -151,11 +192,11 @@ class GapExtractor:
             requirement: The original requirement string
             key_terms: Key terms extracted from requirement
             result: The actual result string
+            result_lower: Lowercased result string
 
         Returns:
             True if requirement appears satisfied, False otherwise
         """
-        result_lower = result.lower()
         requirement_lower = requirement.lower()
 
         # Check type-specific requirements
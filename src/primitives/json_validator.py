@@ -2,7 +2,8 @@
 JSONValidator Primitive
 
 Validates JSON data against schemas using jsonschema library.
-Provides predefined schemas for instructions, result, and feedback.
+Provides predefined schemas for instructions, result, and feedback; their
+validators are compiled once at import time rather than on every call.
 """
 
 from typing import Any
@@ -62,6 +63,12 @@ class JSONValidator:
         "required": ["status", "gaps", "attempt"],
     }
 
+    # Compiled validators for the predefined schemas
+    _INSTRUCTIONS_VALIDATOR = Draft7Validator(INSTRUCTIONS_SCHEMA)
+    _RESULT_VALIDATOR = Draft7Validator(RESULT_SCHEMA)
+    _FEEDBACK_PASS_VALIDATOR = Draft7Validator(FEEDBACK_PASS_SCHEMA)
+    _FEEDBACK_FAIL_VALIDATOR = Draft7Validator(FEEDBACK_FAIL_SCHEMA)
+
     def validate(self, data: dict, schema: dict) -> tuple[bool, list[str]]:
         """
         Validate JSON data against a schema
@@ -75,7 +82,19 @@ class JSONValidator:
                 - is_valid: True if valid, False otherwise
                 - error_messages: List of specific error messages (empty if valid)
         """
-        validator = Draft7Validator(schema)
+        return self._validate_with(Draft7Validator(schema), data)
+
+    def _validate_with(self, validator: Draft7Validator, data: dict) -> tuple[bool, list[str]]:
+        """
+        Validate JSON data with an already compiled validator
+
+        Args:
+            validator: Compiled Draft7Validator
+            data: The JSON data to validate
+
+        Returns:
+            tuple[bool, list[str]]: (is_valid, error_messages)
+        """
         errors = list(validator.iter_errors(data))
 
         if not errors:
@@ -87,11 +106,11 @@ class JSONValidator:
 
     def validate_instructions(self, data: dict) -> tuple[bool, list[str]]:
         """Validate instructions.json against predefined schema"""
-        return self.validate(data, self.INSTRUCTIONS_SCHEMA)
+        return self._validate_with(self._INSTRUCTIONS_VALIDATOR, data)
 
     def validate_result(self, data: dict) -> tuple[bool, list[str]]:
         """Validate result.json against predefined schema"""
-        return self.validate(data, self.RESULT_SCHEMA)
+        return self._validate_with(self._RESULT_VALIDATOR, data)
 
     def validate_feedback(self, data: dict) -> tuple[bool, list[str]]:
         """
@@ -103,9 +122,9 @@ class JSONValidator:
         status = data.get("status")
 
         if status == "PASS":
-            return self.validate(data, self.FEEDBACK_PASS_SCHEMA)
+            return self._validate_with(self._FEEDBACK_PASS_VALIDATOR, data)
         elif status == "FAIL":
-            return self.validate(data, self.FEEDBACK_FAIL_SCHEMA)
+            return self._validate_with(self._FEEDBACK_FAIL_VALIDATOR, data)
         else:
             # Invalid status
             return (False, [f"status: Invalid status '{status}' (must be 'PASS' or 'FAIL')"])
@@ -0,0 +1,172 @@
+"""
+LLMCache Primitive
+
+Cache LLM responses keyed by (provider, prompt) so identical prompts skip the
+provider call. Only use it for deterministic calls (e.g. temperature 0): a
+cached response is replayed verbatim.
+
+Interface:
+- cache_key(provider: str, prompt: str) -> str
+- get(provider: str, prompt: str) -> Optional[dict]
+- set(provider: str, prompt: str, response: dict) -> None
+- clear() -> None
+"""
+
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+
+class CacheBackend(Protocol):
+    """Storage interface for LLMCache (memory, file, Redis, ...)."""
+
+    def get(self, key: str) -> Optional[dict]: ...
+
+    def set(self, key: str, value: dict, ttl: Optional[float] = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend with optional per-entry TTL."""
+
+    DEFAULT_MAXSIZE = 1024
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Initialize empty store of key -> (expires_at, value).
+
+        Args:
+            maxsize: Maximum entries kept; the least recently used is evicted first
+        """
+        self.maxsize = maxsize
+        self._store: OrderedDict[str, tuple[Optional[float], dict]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            dict or None: Cached value, or None if missing or expired
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: dict, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, dropping expired entries and evicting beyond maxsize.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional time-to-live in seconds (None = never expires)
+        """
+        now = time.monotonic()
+        # Expired entries are otherwise only dropped when their key is looked
+        # up again; a set follows an LLM call, so a full sweep is cheap here
+        expired = [k for k, (exp, _) in self._store.items() if exp is not None and now >= exp]
+        for expired_key in expired:
+            del self._store[expired_key]
+
+        self._store[key] = (now + ttl if ttl is not None else None, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        self._store.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._store.clear()
+
+
+class LLMCache:
+    """Response cache for LLM calls with hit/miss statistics."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            backend: Storage backend (default: MemoryCacheBackend)
+            ttl: Optional time-to-live in seconds for new entries
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def cache_key(provider: str, prompt: str) -> str:
+        """
+        Build a stable cache key for a provider/prompt pair.
+
+        Args:
+            provider: LLM provider name
+            prompt: Full prompt text (retry prompts include their gaps)
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        payload = json.dumps({"provider": provider, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, provider: str, prompt: str) -> Optional[dict]:
+        """
+        Look up a cached response, updating hit/miss statistics.
+
+        Args:
+            provider: LLM provider name
+            prompt: Prompt text
+
+        Returns:
+            dict or None: Copy of the cached response, or None on a miss
+        """
+        response = self.backend.get(self.cache_key(provider, prompt))
+        if response is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        # A copy, so a caller mutating its response cannot change later hits
+        return copy.deepcopy(response)
+
+    def set(self, provider: str, prompt: str, response: dict) -> None:
+        """
+        Cache a copy of a response.
+
+        Args:
+            provider: LLM provider name
+            prompt: Prompt text
+            response: LLM response to cache
+        """
+        # Copied so later changes to the caller's response are not cached
+        self.backend.set(self.cache_key(provider, prompt), copy.deepcopy(response), self.ttl)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset statistics."""
+        self.backend.clear()
+        self.stats = {"hits": 0, "misses": 0}
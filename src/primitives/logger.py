@@ -8,31 +8,67 @@ Interface:
 - info(message: str, context: dict = {}) → None
 - warning(message: str, context: dict = {}) → None
 - error(message: str, context: dict = {}) → None
+- is_enabled_for(level: str) → bool
 """
 
+import logging
+import os
 import sys
+import warnings
 from pathlib import Path
 from typing import Optional
 
 import structlog
 
+# Level names accepted by Logger, mapped to stdlib logging levels; the aliases
+# are the other names stdlib logging accepts for these levels
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+# Used when no level is passed and LOG_LEVEL is unset: log everything, as
+# Logger did before it had levels
+_DEFAULT_LEVEL = logging.DEBUG
+
 
 class Logger:
     """Thread-safe structured logger with ISO 8601 timestamps."""
 
-    def __init__(self, output_file: Optional[str] = None):
+    def __init__(self, output_file: Optional[str] = None, level: Optional[str] = None):
         """
         Initialize logger.
 
         Args:
             output_file: Path to log file. If None, logs to stdout.
+            level: Minimum level to log ("debug", "info", "warning", "error",
+                "critical"). If None, uses the LOG_LEVEL environment variable
+                when it is set, and otherwise logs everything ("debug"). Note
+                that a LOG_LEVEL above debug now drops debug messages; an
+                unknown LOG_LEVEL warns and logs everything.
+
+        Raises:
+            ValueError: If level is given and is not a known level name
         """
+        if level is not None:
+            self._min_level = self._level_value(level)
+        else:
+            self._min_level = self._env_level()
         self.output_file = output_file
         self._file_handle = None
         self._configure_structlog()
 
     def _configure_structlog(self):
-        """Configure structlog processors and output."""
+        """Configure structlog processors and output.
+
+        structlog's configuration is process-wide, so it passes every level
+        and each Logger applies its own minimum level.
+        """
         processors = [
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso", utc=True),
@@ -64,10 +100,61 @@ class Logger:
 
         self._logger = structlog.get_logger()
 
+    @staticmethod
+    def _env_level() -> int:
+        """
+        Read the minimum level from LOG_LEVEL, defaulting to debug.
+
+        A bad LOG_LEVEL must not stop every component from constructing, so an
+        unknown value warns and falls back to the default instead of raising.
+        """
+        env_level = os.environ.get("LOG_LEVEL", "").strip()
+        if not env_level:
+            return _DEFAULT_LEVEL
+        try:
+            return _LEVELS[env_level.lower()]
+        except KeyError:
+            warnings.warn(
+                f"Unknown LOG_LEVEL '{env_level}', logging everything",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            return _DEFAULT_LEVEL
+
+    @staticmethod
+    def _level_value(level: str) -> int:
+        """
+        Map a level name (case-insensitive) to its stdlib logging level.
+
+        Raises:
+            ValueError: If level is not a known level name
+        """
+        try:
+            return _LEVELS[level.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown log level: '{level}'") from None
+
     def _normalize_context(self, context: Optional[dict]) -> dict:
         """Normalize context parameter, returning empty dict if None."""
         return context if context is not None else {}
 
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages at a level are logged.
+
+        Lets callers skip building context for messages that would be dropped.
+
+        Args:
+            level: Level name ("debug", "info", "warning", "error", "critical")
+
+        Returns:
+            True if messages at level are logged, False otherwise
+
+        Raises:
+            ValueError: If level is not a known level name
+        """
+        return self._level_value(level) >= self._min_level
+
     def debug(self, message: str, context: Optional[dict] = None) -> None:
         """
         Log DEBUG level message.
@@ -76,7 +163,8 @@ class Logger:
             message: Log message
             context: Optional context dictionary
         """
-        self._logger.debug(message, **self._normalize_context(context))
+        if self._min_level <= logging.DEBUG:
+            self._logger.debug(message, **self._normalize_context(context))
 
     def info(self, message: str, context: Optional[dict] = None) -> None:
         """
@@ -86,7 +174,8 @@ class Logger:
             message: Log message
             context: Optional context dictionary
         """
-        self._logger.info(message, **self._normalize_context(context))
+        if self._min_level <= logging.INFO:
+            self._logger.info(message, **self._normalize_context(context))
 
     def warning(self, message: str, context: Optional[dict] = None) -> None:
         """
@@ -96,7 +185,8 @@ class Logger:
             message: Log message
             context: Optional context dictionary
         """
-        self._logger.warning(message, **self._normalize_context(context))
+        if self._min_level <= logging.WARNING:
+            self._logger.warning(message, **self._normalize_context(context))
 
     def error(self, message: str, context: Optional[dict] = None) -> None:
         """
@@ -106,7 +196,8 @@ class Logger:
             message: Log message
             context: Optional context dictionary
         """
-        self._logger.error(message, **self._normalize_context(context))
+        if self._min_level <= logging.ERROR:
+            self._logger.error(message, **self._normalize_context(context))
 
     def close(self) -> None:
         """Close file handle if open."""
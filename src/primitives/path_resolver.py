@@ -3,40 +3,86 @@
 Resolve project root and create session/pod/worker directories.
 """
 
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Directories whose project root stays cached; least recently used first out,
+# so a long-running process creating many pods does not grow it without bound
+_ROOT_CACHE_SIZE = 1024
+
+# Files or directories marking a project root
+_MARKERS = (".git", "pyproject.toml", "package.json")
+
 
 class PathResolver:
     """Resolve project root and create isolated directory structures"""
 
-    def get_project_root(self, start_path: Path) -> Path:
-        """Detect project root by looking for markers (.git, pyproject.toml, package.json)
+    def __init__(self):
+        # Resolved directory -> project root found at or above it. Sibling pods
+        # share ancestors, so later lookups stop at the first directory already
+        # walked. Only found roots are stored: a walk that finds no marker is
+        # redone next time, so a marker created afterwards is picked up.
+        # Bounded LRU (most recently used last), guarded by _root_lock since
+        # InstructionManager shares one resolver across threads.
+        self._root_cache: OrderedDict[Path, Path] = OrderedDict()
+        self._root_lock = threading.Lock()
+
+    def _root_of(self, directory: Path) -> Path | None:
+        """Find the project root at or above a resolved directory
+
+        Every directory walked on the way to a found root is cached.
 
         Args:
-            start_path: Directory to start searching from
+            directory: Resolved directory to start from
 
         Returns:
-            Path: Project root directory, or start_path if no markers found
+            Path | None: Nearest directory containing a marker, or None
         """
-        current = start_path.resolve()
-        markers = [".git", "pyproject.toml", "package.json"]
-
-        # Traverse upward looking for project markers
+        walked = []
+        current = directory
         while True:
-            # Check if any marker exists in current directory
-            for marker in markers:
-                if (current / marker).exists():
-                    return current
-
-            # If we've reached root and found nothing, return start_path
+            with self._root_lock:
+                root = self._root_cache.get(current)
+                if root is not None:
+                    self._root_cache.move_to_end(current)
+            if root is not None:
+                break
+            walked.append(current)
+            if any((current / marker).exists() for marker in _MARKERS):
+                root = current
+                break
             parent = current.parent
             if parent == current:
-                return start_path
-
+                return None
             current = parent
 
+        # The marker probes above run unlocked; only cache updates are guarded
+        with self._root_lock:
+            for walked_dir in walked:
+                self._root_cache[walked_dir] = root
+            while len(self._root_cache) > _ROOT_CACHE_SIZE:
+                self._root_cache.popitem(last=False)
+        return root
+
+    def get_project_root(self, start_path: Path) -> Path:
+        """Detect project root by looking for markers (.git, pyproject.toml, package.json)
+
+        Found roots are cached per directory walked, so a marker created later
+        between an already resolved directory and its root is not picked up by
+        this instance. Directories with no marker above them are not cached.
+
+        Args:
+            start_path: Directory to start searching from
+
+        Returns:
+            Path: Project root directory, or start_path if no markers found
+        """
+        root = self._root_of(start_path.resolve())
+        return start_path if root is None else root
+
     def create_session_dir(self, project_root: Path, agent_name: str) -> Path:
         """Create isolated session directory with unique name
 